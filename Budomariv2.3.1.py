@@ -1,964 +1,1307 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from datetime import datetime
-import json
-import os
-
-class AutomotiveStampingAnalyzer:
-    """Comprehensive Automotive Stamping Cost Analysis with GUI"""
-    
-    # Version control
-    VERSION = "2.3.1"
-    RELEASE_DATE = "2025-10-22"
-    
-    CHANGE_LOG = [
-        {"version": "2.3.1", "date": "2025-10-22", "changes": [
-            "Added savings clarification (annual vs per metric ton)",
-            "Enhanced results breakdown with per-ton calculations",
-            "Improved savings interpretation in reports"
-        ]},
-        {"version": "2.3.0", "date": "2025-10-22", "changes": [
-            "Added material cost fields in $/MT and $/cwt",
-            "Added currency conversion system",
-            "Updated 'Part Geometry' to 'Blank Geometry'",
-            "Enhanced results clarity with savings explanations",
-            "Updated developer information in reports"
-        ]},
-        {"version": "2.2.0", "date": "2025-10-19", "changes": [
-            "Added thickness optimization fields",
-            "Integrated developer information",
-            "Enhanced material comparison with thickness variables",
-            "Added dual optimization (material + thickness)",
-            "Improved results reporting"
-        ]},
-        {"version": "2.1.0", "date": "2025-10-15", "changes": [
-            "Added comprehensive GUI interface",
-            "Integrated version control system",
-            "Added change log display",
-            "Enhanced user input validation",
-            "Added real-time cost calculations"
-        ]},
-        {"version": "2.0.0", "date": "2025-09-22", "changes": [
-            "Added coil efficiency calculations",
-            "Integrated thickness optimization",
-            "Added comprehensive overhead costing",
-            "Enhanced material property database",
-            "Added nesting efficiency analysis"
-        ]},
-        {"version": "1.0.0", "date": "2025-09-12", "changes": [
-            "Initial release with basic material cost analysis",
-            "Direct material cost calculations",
-            "Basic scrap rate considerations",
-            "Simple material comparison engine"
-        ]}
-    ]
-    
-    # Personal Information
-    DEVELOPER_INFO = {
-        "name": "Luis Rodrigo Palomera",
-        "student_id": "A240619",
-        "institution": "Instituto Politécnico Nacional (IPN) - CICATA Querétaro",
-        "projects": "CVU 881822, SECIHTI 4021946",
-        "github": "lpalomerar2400",
-        "email": "palomera.luis@gmail.com",
-        "specialties": [
-            "Material Switching Optimization",
-            "Stamping Process Cost Analysis",
-            "Lightweighting Strategies",
-            "Supply Chain Cost Reduction",
-            "Advanced Materials Implementation"
-        ]
-    }
-
-        # References and Bibliography
-    REFERENCES = [
-        {
-            "category": "Material Properties & Standards",
-            "sources": [
-                "ASTM International. (2023). Standard Specification for Steel, Sheet, Carbon, and High-Strength, Low-Alloy for Automotive Applications.",
-                "ASM International. (2022). ASM Handbook, Volume 14B: Metalworking: Sheet Forming.",
-                "European Aluminum Association. (2024). Automotive Aluminum Design Manual.",
-                "International Magnesium Association. (2023). Magnesium Applications in Automotive Industry."
-            ]
-        },
-        {
-            "category": "Cost Analysis Methodology",
-            "sources": [
-                "Society of Automotive Engineers. (2024). SAE J4002 - Life Cycle Cost Analysis for Automotive Materials.",
-                "International Organization for Standardization. (2023). ISO 14040: Environmental Management - Life Cycle Assessment.",
-                "Kalpakjian, S., & Schmid, S. R. (2024). Manufacturing Engineering and Technology. Pearson Education.",
-                "Groover, M. P. (2023). Fundamentals of Modern Manufacturing: Materials, Processes, and Systems. Wiley."
-            ]
-        },
-        {
-            "category": "Stamping Process Optimization",
-            "sources": [
-                "American Metal Stamping Association. (2024). Best Practices in Automotive Stamping.",
-                "Tschätsch, H. (2023). Metal Forming Practise: Processes - Machines - Tools. Springer.",
-                "Lange, K. (2022). Handbook of Metal Forming. Society of Manufacturing Engineers.",
-                "Narasimhan, K., & Miles, M. P. (2024). Advanced Stamping Technologies for Lightweight Vehicles."
-            ]
-        },
-        {
-            "category": "Industry Data & Market Analysis",
-            "sources": [
-                "World Steel Association. (2024). Steel Statistical Yearbook 2024.",
-                "International Aluminum Institute. (2024). Aluminum Automotive Manual.",
-                "Ducker Worldwide. (2024). North American Light Vehicle Aluminum Content Study.",
-                "McKinsey & Company. (2024). Automotive Materials Cost Optimization Strategies."
-            ]
-        },
-        {
-            "category": "Software & Technical Resources",
-            "sources": [
-                "Python Software Foundation. (2024). Python 3.12 Documentation.",
-                "Matplotlib Development Team. (2024). Matplotlib: Visualization with Python.",
-                "Pandas Development Team. (2024). pandas: Python Data Analysis Library.",
-                "TKinter Documentation. (2024). GUI Programming with Tkinter."
-            ]
-        },
-        {
-            "category": "Academic Research",
-            "sources": [
-                "MIT Materials Processing Center. (2024). Lightweight Materials for Automotive Applications.",
-                "University of Michigan. (2024). Automotive Research Center Publications.",
-                "Fraunhofer Institute. (2024). Production Technology and Lightweight Design Research.",
-                "University of Cambridge. (2024). Advanced Materials and Processing Research Group."
-            ]
-        }
-    ]
-    
-    def __init__(self, root):
-        self.root = root
-        self.root.title(f"Automotive Stamping Cost Analyzer v{self.VERSION}")
-        self.root.geometry("1400x900")
-        
-        # Initialize data
-        self.setup_materials_database()
-        self.setup_default_parameters()
-        
-        # Create GUI
-        self.create_gui()
-        
-    def setup_materials_database(self):
-        """Initialize materials database"""
-        self.materials = {
-            'Mild Steel': {
-                'density': 7.85, 'cost_per_kg': 0.8, 'scrap_value': 0.2,
-                'stamping_pressure_required': 400, 'energy_per_kg': 1.2,
-                'tooling_wear_factor': 1.0, 'processing_time': 1.0,
-                'typical_thickness_range': (0.6, 3.0),
-                'max_thickness_reduction': 0.15,
-                'formability_index': 1.0,
-                'springback_factor': 1.0,
-                'typical_coil_widths': [1200, 1500, 1800]
-            },
-            'High Strength Steel': {
-                'density': 7.85, 'cost_per_kg': 1.2, 'scrap_value': 0.25,
-                'stamping_pressure_required': 600, 'energy_per_kg': 1.5,
-                'tooling_wear_factor': 1.3, 'processing_time': 1.2,
-                'typical_thickness_range': (0.8, 2.5),
-                'max_thickness_reduction': 0.10,
-                'formability_index': 0.8,
-                'springback_factor': 1.3,
-                'typical_coil_widths': [1200, 1500]
-            },
-            'Aluminum 6061': {
-                'density': 2.7, 'cost_per_kg': 3.5, 'scrap_value': 1.8,
-                'stamping_pressure_required': 300, 'energy_per_kg': 0.8,
-                'tooling_wear_factor': 0.7, 'processing_time': 0.9,
-                'typical_thickness_range': (0.8, 4.0),
-                'max_thickness_reduction': 0.20,
-                'formability_index': 1.4,
-                'springback_factor': 0.7,
-                'typical_coil_widths': [1200, 1500, 2000]
-            },
-            'Aluminum 5052': {
-                'density': 2.68, 'cost_per_kg': 3.2, 'scrap_value': 1.6,
-                'stamping_pressure_required': 280, 'energy_per_kg': 0.75,
-                'tooling_wear_factor': 0.6, 'processing_time': 0.85,
-                'typical_thickness_range': (0.7, 3.5),
-                'max_thickness_reduction': 0.25,
-                'formability_index': 1.6,
-                'springback_factor': 0.6,
-                'typical_coil_widths': [1200, 1500, 2000]
-            },
-            'Advanced High Strength Steel': {
-                'density': 7.85, 'cost_per_kg': 1.8, 'scrap_value': 0.3,
-                'stamping_pressure_required': 800, 'energy_per_kg': 2.0,
-                'tooling_wear_factor': 1.8, 'processing_time': 1.5,
-                'typical_thickness_range': (0.9, 2.2),
-                'max_thickness_reduction': 0.08,
-                'formability_index': 0.6,
-                'springback_factor': 1.8,
-                'typical_coil_widths': [1200, 1500]
-            },
-            'Magnesium AZ31': {
-                'density': 1.74, 'cost_per_kg': 5.2, 'scrap_value': 2.5,
-                'stamping_pressure_required': 250, 'energy_per_kg': 0.6,
-                'tooling_wear_factor': 0.5, 'processing_time': 0.8,
-                'typical_thickness_range': (1.0, 4.5),
-                'max_thickness_reduction': 0.30,
-                'formability_index': 1.8,
-                'springback_factor': 0.5,
-                'typical_coil_widths': [1200, 1500, 2000]
-            }
-        }
-    
-    def setup_default_parameters(self):
-        """Set default cost parameters"""
-        self.cost_params = {
-            'energy_cost_per_kwh': 0.12,
-            'operator_hourly_rate': 35.0,
-            'supervision_cost_per_operator': 15.0,
-            'maintenance_cost_per_hour': 25.0,
-            'equipment_depreciation_hourly': 40.0,
-            'facility_cost_per_hour': 15.0,
-            'tooling_cost_per_stroke': 0.02,
-            'quality_control_cost_per_part': 0.50,
-            'coil_handling_cost_per_ton': 50.0,
-            'scrap_processing_cost_per_kg': 0.10,
-            'shipping_cost_per_kg': 0.25
-        }
-        
-        # Currency exchange rates (default values)
-        self.currency_rates = {
-            'EUR': 0.92,
-            'GBP': 0.79,
-            'JPY': 148.50,
-            'MXN': 17.25
-        }
-    
-    def create_gui(self):
-        """Create the main GUI interface"""
-        # Create notebook for tabs
-        self.notebook = ttk.Notebook(self.root)
-        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # Create tabs
-        self.setup_input_tab()
-        self.setup_materials_tab()
-        self.setup_costs_tab()
-        self.setup_results_tab()
-        self.setup_about_tab()
-        
-    def setup_input_tab(self):
-        """Setup input parameters tab"""
-        self.input_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.input_frame, text="Part & Production")
-        
-        # Header
-        header_frame = ttk.LabelFrame(self.input_frame, text="Blank Geometry & Production Parameters")
-        header_frame.pack(fill='x', padx=5, pady=5)
-        
-        ttk.Label(header_frame, text=f"Automotive Stamping Cost Analyzer v{self.VERSION}", 
-                 font=('Arial', 12, 'bold')).pack(pady=5)
-        
-        # Blank Geometry (CTL only)
-        geometry_frame = ttk.LabelFrame(self.input_frame, text="Blank Geometry (CTL only)")
-        geometry_frame.pack(fill='x', padx=5, pady=5)
-        
-        # Row 1 - Basic dimensions
-        row1 = ttk.Frame(geometry_frame)
-        row1.pack(fill='x', pady=2)
-        
-        ttk.Label(row1, text="Length (mm):").grid(row=0, column=0, sticky='w', padx=5)
-        self.part_length = ttk.Entry(row1, width=10)
-        self.part_length.insert(0, "800")
-        self.part_length.grid(row=0, column=1, padx=5)
-        
-        ttk.Label(row1, text="Width (mm):").grid(row=0, column=2, sticky='w', padx=5)
-        self.part_width = ttk.Entry(row1, width=10)
-        self.part_width.insert(0, "600")
-        self.part_width.grid(row=0, column=3, padx=5)
-        
-        # Thickness Optimization Frame
-        thickness_frame = ttk.LabelFrame(self.input_frame, text="Thickness Optimization")
-        thickness_frame.pack(fill='x', padx=5, pady=5)
-        
-        # Row 2 - Current thickness
-        row2 = ttk.Frame(thickness_frame)
-        row2.pack(fill='x', pady=2)
-        
-        ttk.Label(row2, text="Current Thickness (mm):").grid(row=0, column=0, sticky='w', padx=5)
-        self.current_thickness = ttk.Entry(row2, width=10)
-        self.current_thickness.insert(0, "1.2")
-        self.current_thickness.grid(row=0, column=1, padx=5)
-        
-        ttk.Label(row2, text="Optimized Thickness (mm):").grid(row=0, column=2, sticky='w', padx=5)
-        self.optimized_thickness = ttk.Entry(row2, width=10)
-        self.optimized_thickness.insert(0, "1.0")
-        self.optimized_thickness.grid(row=0, column=3, padx=5)
-        
-        ttk.Label(row2, text="Thickness Reduction (%):").grid(row=0, column=4, sticky='w', padx=5)
-        self.thickness_reduction_label = ttk.Label(row2, text="16.7%", foreground="blue")
-        self.thickness_reduction_label.grid(row=0, column=5, padx=5)
-        
-        # Bind thickness calculation
-        self.current_thickness.bind('<KeyRelease>', self.calculate_thickness_reduction)
-        self.optimized_thickness.bind('<KeyRelease>', self.calculate_thickness_reduction)
-        
-        # Material Cost Input Frame
-        material_cost_frame = ttk.LabelFrame(self.input_frame, text="Material Cost Input")
-        material_cost_frame.pack(fill='x', padx=5, pady=5)
-        
-        # Row 3 - Material cost inputs
-        row3 = ttk.Frame(material_cost_frame)
-        row3.pack(fill='x', pady=2)
-        
-        ttk.Label(row3, text="Current Material Cost ($/MT):").grid(row=0, column=0, sticky='w', padx=5)
-        self.current_material_cost_mt = ttk.Entry(row3, width=12)
-        self.current_material_cost_mt.insert(0, "800")
-        self.current_material_cost_mt.grid(row=0, column=1, padx=5)
-        
-        ttk.Label(row3, text="($/cwt):").grid(row=0, column=2, sticky='w', padx=5)
-        self.current_material_cost_cwt = ttk.Entry(row3, width=12)
-        self.current_material_cost_cwt.insert(0, "36.29")
-        self.current_material_cost_cwt.grid(row=0, column=3, padx=5)
-        
-        ttk.Label(row3, text="Proposed Material Cost ($/MT):").grid(row=0, column=4, sticky='w', padx=5)
-        self.proposed_material_cost_mt = ttk.Entry(row3, width=12)
-        self.proposed_material_cost_mt.insert(0, "3200")
-        self.proposed_material_cost_mt.grid(row=0, column=5, padx=5)
-        
-        ttk.Label(row3, text="($/cwt):").grid(row=0, column=6, sticky='w', padx=5)
-        self.proposed_material_cost_cwt = ttk.Entry(row3, width=12)
-        self.proposed_material_cost_cwt.insert(0, "145.15")
-        self.proposed_material_cost_cwt.grid(row=0, column=7, padx=5)
-        
-        # Bind cost conversions
-        self.current_material_cost_mt.bind('<KeyRelease>', lambda e: self.convert_mt_to_cwt('current'))
-        self.current_material_cost_cwt.bind('<KeyRelease>', lambda e: self.convert_cwt_to_mt('current'))
-        self.proposed_material_cost_mt.bind('<KeyRelease>', lambda e: self.convert_mt_to_cwt('proposed'))
-        self.proposed_material_cost_cwt.bind('<KeyRelease>', lambda e: self.convert_cwt_to_mt('proposed'))
-        
-        # Production Parameters
-        production_frame = ttk.LabelFrame(self.input_frame, text="Production Parameters")
-        production_frame.pack(fill='x', padx=5, pady=5)
-        
-        # Row 4
-        row4 = ttk.Frame(production_frame)
-        row4.pack(fill='x', pady=2)
-        
-        ttk.Label(row4, text="Annual Volume:").grid(row=0, column=0, sticky='w', padx=5)
-        self.annual_volume = ttk.Entry(row4, width=15)
-        self.annual_volume.insert(0, "150000")
-        self.annual_volume.grid(row=0, column=1, padx=5)
-        
-        ttk.Label(row4, text="Shifts per Day:").grid(row=0, column=2, sticky='w', padx=5)
-        self.shifts_per_day = ttk.Entry(row4, width=10)
-        self.shifts_per_day.insert(0, "2")
-        self.shifts_per_day.grid(row=0, column=3, padx=5)
-        
-        ttk.Label(row4, text="Operating Days/Year:").grid(row=0, column=4, sticky='w', padx=5)
-        self.operating_days = ttk.Entry(row4, width=10)
-        self.operating_days.insert(0, "250")
-        self.operating_days.grid(row=0, column=5, padx=5)
-        
-        # Strip Parameters
-        strip_frame = ttk.LabelFrame(self.input_frame, text="Strip Parameters")
-        strip_frame.pack(fill='x', padx=5, pady=5)
-        
-        # Row 5
-        row5 = ttk.Frame(strip_frame)
-        row5.pack(fill='x', pady=2)
-        
-        ttk.Label(row5, text="Strip Width (mm):").grid(row=0, column=0, sticky='w', padx=5)
-        self.coil_width = ttk.Entry(row5, width=10)
-        self.coil_width.insert(0, "1500")
-        self.coil_width.grid(row=0, column=1, padx=5)
-        
-        ttk.Label(row5, text="Strip Weight (kg):").grid(row=0, column=2, sticky='w', padx=5)
-        self.coil_weight = ttk.Entry(row5, width=10)
-        self.coil_weight.insert(0, "20000")
-        self.coil_weight.grid(row=0, column=3, padx=5)
-        
-        ttk.Label(row5, text="Coil Change Time (min):").grid(row=0, column=4, sticky='w', padx=5)
-        self.coil_change_time = ttk.Entry(row5, width=10)
-        self.coil_change_time.insert(0, "30")
-        self.coil_change_time.grid(row=0, column=5, padx=5)
-        
-        # Material Selection
-        material_frame = ttk.LabelFrame(self.input_frame, text="Material Selection")
-        material_frame.pack(fill='x', padx=5, pady=5)
-        
-        # Row 6
-        row6 = ttk.Frame(material_frame)
-        row6.pack(fill='x', pady=2)
-        
-        ttk.Label(row6, text="Current Material:").grid(row=0, column=0, sticky='w', padx=5)
-        self.current_material = ttk.Combobox(row6, values=list(self.materials.keys()), width=15)
-        self.current_material.set("Mild Steel")
-        self.current_material.grid(row=0, column=1, padx=5)
-        
-        ttk.Label(row6, text="Proposed Material:").grid(row=0, column=2, sticky='w', padx=5)
-        self.proposed_material = ttk.Combobox(row6, values=list(self.materials.keys()), width=15)
-        self.proposed_material.set("Aluminum 5052")
-        self.proposed_material.grid(row=0, column=3, padx=5)
-        
-        # Analysis Type
-        analysis_frame = ttk.LabelFrame(self.input_frame, text="Analysis Type")
-        analysis_frame.pack(fill='x', padx=5, pady=5)
-        
-        self.analysis_type = tk.StringVar(value="both")
-        ttk.Radiobutton(analysis_frame, text="Material Switch Only", 
-                       variable=self.analysis_type, value="material").pack(side='left', padx=10)
-        ttk.Radiobutton(analysis_frame, text="Thickness Optimization Only", 
-                       variable=self.analysis_type, value="thickness").pack(side='left', padx=10)
-        ttk.Radiobutton(analysis_frame, text="Both Material Switch & Thickness Optimization", 
-                       variable=self.analysis_type, value="both").pack(side='left', padx=10)
-        
-        # Calculate Button
-        button_frame = ttk.Frame(self.input_frame)
-        button_frame.pack(fill='x', pady=10)
-        
-        ttk.Button(button_frame, text="Calculate Cost Analysis", 
-                  command=self.calculate_analysis).pack(pady=5)
-    
-    def convert_mt_to_cwt(self, material_type):
-        """Convert $/MT to $/cwt"""
-        try:
-            if material_type == 'current':
-                mt_value = float(self.current_material_cost_mt.get())
-                cwt_value = mt_value / 22.046  # 1 MT = 22.046 cwt
-                self.current_material_cost_cwt.delete(0, tk.END)
-                self.current_material_cost_cwt.insert(0, f"{cwt_value:.2f}")
-            else:
-                mt_value = float(self.proposed_material_cost_mt.get())
-                cwt_value = mt_value / 22.046
-                self.proposed_material_cost_cwt.delete(0, tk.END)
-                self.proposed_material_cost_cwt.insert(0, f"{cwt_value:.2f}")
-        except ValueError:
-            pass
-    
-    def convert_cwt_to_mt(self, material_type):
-        """Convert $/cwt to $/MT"""
-        try:
-            if material_type == 'current':
-                cwt_value = float(self.current_material_cost_cwt.get())
-                mt_value = cwt_value * 22.046
-                self.current_material_cost_mt.delete(0, tk.END)
-                self.current_material_cost_mt.insert(0, f"{mt_value:.0f}")
-            else:
-                cwt_value = float(self.proposed_material_cost_cwt.get())
-                mt_value = cwt_value * 22.046
-                self.proposed_material_cost_mt.delete(0, tk.END)
-                self.proposed_material_cost_mt.insert(0, f"{mt_value:.0f}")
-        except ValueError:
-            pass
-    
-    def calculate_thickness_reduction(self, event=None):
-        """Calculate and display thickness reduction percentage"""
-        try:
-            current = float(self.current_thickness.get())
-            optimized = float(self.optimized_thickness.get())
-            reduction = ((current - optimized) / current) * 100
-            self.thickness_reduction_label.config(text=f"{reduction:.1f}%")
-            
-            # Color code based on reduction
-            if reduction > 20:
-                self.thickness_reduction_label.config(foreground="green")
-            elif reduction > 10:
-                self.thickness_reduction_label.config(foreground="blue")
-            else:
-                self.thickness_reduction_label.config(foreground="orange")
-                
-        except (ValueError, ZeroDivisionError):
-            self.thickness_reduction_label.config(text="0.0%")
-    
-    def setup_materials_tab(self):
-        """Setup materials properties tab"""
-        self.materials_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.materials_frame, text="Material Properties")
-        
-        # Create treeview for materials
-        columns = ('Property', 'Mild Steel', 'High Strength Steel', 'Aluminum 6061', 'Aluminum 5052', 'AHSS', 'Magnesium')
-        self.materials_tree = ttk.Treeview(self.materials_frame, columns=columns, show='headings', height=15)
-        
-        for col in columns:
-            self.materials_tree.heading(col, text=col)
-            self.materials_tree.column(col, width=100)
-        
-        # Add material data
-        material_data = [
-            ('Density (g/cm³)', '7.85', '7.85', '2.70', '2.68', '7.85', '1.74'),
-            ('Cost ($/kg)', '0.80', '1.20', '3.50', '3.20', '1.80', '5.20'),
-            ('Scrap Value ($/kg)', '0.20', '0.25', '1.80', '1.60', '0.30', '2.50'),
-            ('Stamping Pressure (MPa)', '400', '600', '300', '280', '800', '250'),
-            ('Energy (kWh/kg)', '1.20', '1.50', '0.80', '0.75', '2.00', '0.60'),
-            ('Tool Wear Factor', '1.00', '1.30', '0.70', '0.60', '1.80', '0.50'),
-            ('Processing Time (s)', '1.00', '1.20', '0.90', '0.85', '1.50', '0.80'),
-            ('Max Thickness Reduction', '15%', '10%', '20%', '25%', '8%', '30%'),
-            ('Formability Index', '1.00', '0.80', '1.40', '1.60', '0.60', '1.80')
-        ]
-        
-        for data in material_data:
-            self.materials_tree.insert('', 'end', values=data)
-        
-        self.materials_tree.pack(fill='both', expand=True, padx=5, pady=5)
-        
-        # Notes frame
-        notes_frame = ttk.LabelFrame(self.materials_frame, text="Material Selection Notes")
-        notes_frame.pack(fill='x', padx=5, pady=5)
-        
-        notes_text = """
-        • Mild Steel: Cost-effective, good formability, higher weight
-        • High Strength Steel: Higher strength, reduced thickness possible, higher tool wear
-        • Aluminum 6061: Good strength-to-weight, excellent corrosion resistance
-        • Aluminum 5052: Excellent formability, good corrosion resistance, lower strength than 6061
-        • Advanced High Strength Steel (AHSS): Highest strength, limited formability, high tool wear
-        • Magnesium AZ31: Lightest option, excellent formability, higher material cost
-        """
-        
-        ttk.Label(notes_frame, text=notes_text, justify='left').pack(padx=5, pady=5)
-    
-    def setup_costs_tab(self):
-        """Setup cost parameters tab with currency conversion"""
-        self.costs_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.costs_frame, text="Cost Parameters")
-        
-        # Create main container with two columns
-        main_container = ttk.Frame(self.costs_frame)
-        main_container.pack(fill='both', expand=True, padx=5, pady=5)
-        
-        # Left Column - Cost Parameters
-        cost_params_frame = ttk.LabelFrame(main_container, text="Cost Parameters (All values in USD)")
-        cost_params_frame.pack(side='left', fill='both', expand=True, padx=(0, 5))
-        
-        # Create input fields for cost parameters
-        self.cost_entries = {}
-        row = 0
-        
-        for param, value in self.cost_params.items():
-            # Convert parameter name to readable format
-            label_text = param.replace('_', ' ').title() + " (USD):"
-            
-            ttk.Label(cost_params_frame, text=label_text).grid(row=row, column=0, sticky='w', padx=5, pady=2)
-            entry = ttk.Entry(cost_params_frame, width=15)
-            entry.insert(0, str(value))
-            entry.grid(row=row, column=1, padx=5, pady=2)
-            
-            self.cost_entries[param] = entry
-            row += 1
-        
-        # Update button
-        ttk.Button(cost_params_frame, text="Update Cost Parameters", 
-                  command=self.update_cost_parameters).grid(row=row, column=0, columnspan=2, pady=10)
-        
-        # Right Column - Currency Conversion
-        currency_frame = ttk.LabelFrame(main_container, text="Currency Conversion (from USD)")
-        currency_frame.pack(side='right', fill='both', expand=True, padx=(5, 0))
-        
-        # Currency exchange rate inputs
-        ttk.Label(currency_frame, text="Euro (EUR):", font=('Arial', 9, 'bold')).grid(row=0, column=0, sticky='w', padx=5, pady=2)
-        self.eur_rate = ttk.Entry(currency_frame, width=10)
-        self.eur_rate.insert(0, str(self.currency_rates['EUR']))
-        self.eur_rate.grid(row=0, column=1, padx=5, pady=2)
-        
-        ttk.Label(currency_frame, text="British Pound (GBP):", font=('Arial', 9, 'bold')).grid(row=1, column=0, sticky='w', padx=5, pady=2)
-        self.gbp_rate = ttk.Entry(currency_frame, width=10)
-        self.gbp_rate.insert(0, str(self.currency_rates['GBP']))
-        self.gbp_rate.grid(row=1, column=1, padx=5, pady=2)
-        
-        ttk.Label(currency_frame, text="Japanese Yen (JPY):", font=('Arial', 9, 'bold')).grid(row=2, column=0, sticky='w', padx=5, pady=2)
-        self.jpy_rate = ttk.Entry(currency_frame, width=10)
-        self.jpy_rate.insert(0, str(self.currency_rates['JPY']))
-        self.jpy_rate.grid(row=2, column=1, padx=5, pady=2)
-        
-        ttk.Label(currency_frame, text="Mexican Peso (MXN):", font=('Arial', 9, 'bold')).grid(row=3, column=0, sticky='w', padx=5, pady=2)
-        self.mxn_rate = ttk.Entry(currency_frame, width=10)
-        self.mxn_rate.insert(0, str(self.currency_rates['MXN']))
-        self.mxn_rate.grid(row=3, column=1, padx=5, pady=2)
-        
-        # Convert button
-        ttk.Button(currency_frame, text="Update Exchange Rates", 
-                  command=self.update_currency_rates).grid(row=4, column=0, columnspan=2, pady=10)
-        
-        # Conversion example
-        example_label = ttk.Label(currency_frame, text="Note: Enter exchange rates as units of foreign currency per 1 USD", 
-                                 font=('Arial', 8), foreground='blue')
-        example_label.grid(row=5, column=0, columnspan=2, pady=5)
-    
-    def update_currency_rates(self):
-        """Update currency exchange rates from user input"""
-        try:
-            self.currency_rates['EUR'] = float(self.eur_rate.get())
-            self.currency_rates['GBP'] = float(self.gbp_rate.get())
-            self.currency_rates['JPY'] = float(self.jpy_rate.get())
-            self.currency_rates['MXN'] = float(self.mxn_rate.get())
-            messagebox.showinfo("Success", "Currency exchange rates updated successfully!")
-        except ValueError as e:
-            messagebox.showerror("Error", f"Invalid input in exchange rates: {e}")
-    
-    def setup_results_tab(self):
-        """Setup results display tab"""
-        self.results_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.results_frame, text="Analysis Results")
-        
-        # Results text area
-        self.results_text = scrolledtext.ScrolledText(self.results_frame, width=100, height=30)
-        self.results_text.pack(fill='both', expand=True, padx=5, pady=5)
-        
-        # Default message
-        self.results_text.insert('1.0', "Click 'Calculate Cost Analysis' in the Part & Production tab to generate results.")
-        self.results_text.config(state='disabled')
-    
-    def setup_about_tab(self):
-        """Setup about information tab with three-column layout"""
-        self.about_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.about_frame, text="About & Version")
-        
-        # Create main container with three columns
-        main_container = ttk.Frame(self.about_frame)
-        main_container.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # Left Column - Developer Information
-        left_frame = ttk.LabelFrame(main_container, text="Developer Information")
-        left_frame.pack(side='left', fill='both', expand=True, padx=(0, 5))
-        
-        developer_text = f"""
-{self.DEVELOPER_INFO['name']}
-Student ID: {self.DEVELOPER_INFO['student_id']}
-
-Institution:
-{self.DEVELOPER_INFO['institution']}
-
-Projects:
-{self.DEVELOPER_INFO['projects']}
-
-Contact:
-GitHub: {self.DEVELOPER_INFO['github']}
-Email: {self.DEVELOPER_INFO['email']}
-
-Specialties:
-"""
-        for specialty in self.DEVELOPER_INFO['specialties']:
-            developer_text += f"• {specialty}\n"
-        
-        developer_label = ttk.Label(left_frame, text=developer_text, justify='left')
-        developer_label.pack(padx=10, pady=10, fill='both', expand=True)
-        
-        # Middle Column - Software Information
-        middle_frame = ttk.LabelFrame(main_container, text="Software Information")
-        middle_frame.pack(side='left', fill='both', expand=True, padx=5)
-        
-        software_text = f"""
-Automotive Stamping Cost Analyzer
-
-Version: {self.VERSION}
-Release Date: {self.RELEASE_DATE}
-
-This software provides comprehensive cost analysis 
-for automotive stamping operations, including:
-
-• Material switching optimization
-• Thickness reduction analysis  
-• Strip processing efficiency
-• Comprehensive overhead costing
-• Real-time cost savings estimation
-• Professional reporting
-
-Key Features:
-• Material database with 6 automotive materials
-• Thickness optimization calculations
-• Strip efficiency and nesting analysis
-• Labor, energy, and equipment cost integration
-• Multiple analysis types (material, thickness, or both)
-• Professional reporting with recommendations
-"""
-        
-        software_label = ttk.Label(middle_frame, text=software_text, justify='left')
-        software_label.pack(padx=10, pady=10, fill='both', expand=True)
-        
-        # Right Column - References
-        right_frame = ttk.LabelFrame(main_container, text="References & Bibliography")
-        right_frame.pack(side='right', fill='both', expand=True, padx=(5, 0))
-        
-        # Create scrollable text for references
-        references_text = scrolledtext.ScrolledText(right_frame, width=40, height=20)
-        references_text.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # Populate references
-        references_text.insert('1.0', "REFERENCES & BIBLIOGRAPHY\n")
-        references_text.insert('end', "=" * 50 + "\n\n")
-        
-        for category in self.REFERENCES:
-            references_text.insert('end', f"{category['category'].upper()}:\n")
-            references_text.insert('end', "-" * 30 + "\n")
-            for source in category['sources']:
-                references_text.insert('end', f"• {source}\n")
-            references_text.insert('end', "\n")
-        
-        references_text.config(state='disabled')
-        
-        # Version History - Full width below the three columns
-        log_frame = ttk.LabelFrame(self.about_frame, text="Version History & Change Log")
-        log_frame.pack(fill='both', expand=True, padx=10, pady=(10, 5))
-        
-        log_text = scrolledtext.ScrolledText(log_frame, width=80, height=15)
-        log_text.pack(fill='both', expand=True, padx=5, pady=5)
-        
-        # Populate change log
-        for version_info in self.CHANGE_LOG:
-            log_text.insert('end', f"\nVersion {version_info['version']} ({version_info['date']}):\n")
-            for change in version_info['changes']:
-                log_text.insert('end', f"  • {change}\n")
-        
-        log_text.config(state='disabled')
-    
-    def update_cost_parameters(self):
-        """Update cost parameters from user input"""
-        try:
-            for param, entry in self.cost_entries.items():
-                self.cost_params[param] = float(entry.get())
-            messagebox.showinfo("Success", "Cost parameters updated successfully!")
-        except ValueError as e:
-            messagebox.showerror("Error", f"Invalid input in cost parameters: {e}")
-    
-    def calculate_analysis(self):
-        """Perform comprehensive cost analysis"""
-        try:
-            # Get input values
-            inputs = self.get_input_values()
-            
-            # Perform calculations
-            results = self.perform_calculations(inputs)
-            
-            # Display results
-            self.display_results(results, inputs)
-            
-        except Exception as e:
-            messagebox.showerror("Calculation Error", f"An error occurred during calculation: {e}")
-    
-    def get_input_values(self):
-        """Get and validate input values"""
-        inputs = {
-            'part_length': float(self.part_length.get()),
-            'part_width': float(self.part_width.get()),
-            'current_thickness': float(self.current_thickness.get()),
-            'optimized_thickness': float(self.optimized_thickness.get()),
-            'current_material_cost_mt': float(self.current_material_cost_mt.get()),
-            'proposed_material_cost_mt': float(self.proposed_material_cost_mt.get()),
-            'annual_volume': int(self.annual_volume.get()),
-            'shifts_per_day': int(self.shifts_per_day.get()),
-            'operating_days': int(self.operating_days.get()),
-            'coil_width': float(self.coil_width.get()),
-            'coil_weight': float(self.coil_weight.get()),
-            'coil_change_time': float(self.coil_change_time.get()),
-            'current_material': self.current_material.get(),
-            'proposed_material': self.proposed_material.get(),
-            'analysis_type': self.analysis_type.get()
-        }
-        
-        # Validate materials
-        if inputs['current_material'] not in self.materials:
-            raise ValueError(f"Invalid current material: {inputs['current_material']}")
-        if inputs['proposed_material'] not in self.materials:
-            raise ValueError(f"Invalid proposed material: {inputs['proposed_material']}")
-        
-        # Validate thickness reduction
-        current_mat = self.materials[inputs['current_material']]
-        max_reduction = current_mat['max_thickness_reduction']
-        actual_reduction = (inputs['current_thickness'] - inputs['optimized_thickness']) / inputs['current_thickness']
-        
-        if actual_reduction > max_reduction:
-            messagebox.showwarning("Thickness Warning", 
-                                 f"Warning: Proposed thickness reduction ({actual_reduction:.1%}) exceeds maximum recommended ({max_reduction:.1%}) for {inputs['current_material']}")
-        
-        return inputs
-    
-    def perform_calculations(self, inputs):
-        """Perform the main cost calculations"""
-        current_mat = self.materials[inputs['current_material']]
-        proposed_mat = self.materials[inputs['proposed_material']]
-        
-        # Override material costs with user inputs (convert $/MT to $/kg)
-        current_mat_cost_per_kg = inputs['current_material_cost_mt'] / 1000
-        proposed_mat_cost_per_kg = inputs['proposed_material_cost_mt'] / 1000
-        
-        # Calculate part area
-        part_area_cm2 = (inputs['part_length'] * inputs['part_width']) / 100  # cm²
-        
-        # Calculate weights for different scenarios
-        current_weight_original = self.calculate_weight(current_mat, part_area_cm2, inputs['current_thickness'])
-        current_weight_optimized = self.calculate_weight(current_mat, part_area_cm2, inputs['optimized_thickness'])
-        proposed_weight_original = self.calculate_weight(proposed_mat, part_area_cm2, inputs['current_thickness'])
-        proposed_weight_optimized = self.calculate_weight(proposed_mat, part_area_cm2, inputs['optimized_thickness'])
-        
-        # Determine which scenario to use based on analysis type
-        if inputs['analysis_type'] == 'material':
-            # Material switch only - keep original thickness
-            current_weight = current_weight_original
-            proposed_weight = proposed_weight_original
-            thickness_note = "Material switch only (original thickness maintained)"
-            
-        elif inputs['analysis_type'] == 'thickness':
-            # Thickness optimization only - keep current material
-            current_weight = current_weight_original
-            proposed_weight = current_weight_optimized
-            thickness_note = "Thickness optimization only (current material)"
-            inputs['proposed_material'] = inputs['current_material']  # Override for reporting
-            
-        else:  # 'both'
-            # Both material switch and thickness optimization
-            current_weight = current_weight_original
-            proposed_weight = proposed_weight_optimized
-            thickness_note = "Material switch + thickness optimization"
-        
-        # Material costs using user-input costs
-        current_material_cost = current_weight * current_mat_cost_per_kg
-        proposed_material_cost = proposed_weight * proposed_mat_cost_per_kg
-        
-        # Weight savings
-        weight_saving_kg = current_weight - proposed_weight
-        weight_reduction_pct = (weight_saving_kg / current_weight) * 100
-        
-        # Cost savings
-        material_saving_per_part = current_material_cost - proposed_material_cost
-        annual_material_saving = material_saving_per_part * inputs['annual_volume']
-        
-        # Strip efficiency calculations
-        current_parts_per_strip = (inputs['coil_weight'] / current_weight) * 0.85
-        proposed_parts_per_strip = (inputs['coil_weight'] / proposed_weight) * 0.85
-        
-        # Coil change savings (keeping this term as it refers to the time component)
-        current_coil_changes = inputs['annual_volume'] / current_parts_per_strip
-        proposed_coil_changes = inputs['annual_volume'] / proposed_parts_per_strip
-        coil_change_saving = (current_coil_changes - proposed_coil_changes) * inputs['coil_change_time'] / 60 * self.cost_params['operator_hourly_rate']
-        
-        return {
-            'current_weight_kg': current_weight,
-            'proposed_weight_kg': proposed_weight,
-            'weight_saving_kg': weight_saving_kg,
-            'weight_reduction_pct': weight_reduction_pct,
-            'current_material_cost': current_material_cost,
-            'proposed_material_cost': proposed_material_cost,
-            'material_saving_per_part': material_saving_per_part,
-            'annual_material_saving': annual_material_saving,
-            'current_parts_per_strip': current_parts_per_strip,
-            'proposed_parts_per_strip': proposed_parts_per_strip,
-            'coil_change_saving': coil_change_saving,
-            'part_area_cm2': part_area_cm2,
-            'thickness_note': thickness_note,
-            'analysis_type': inputs['analysis_type'],
-            'current_mat_cost_per_kg': current_mat_cost_per_kg,
-            'proposed_mat_cost_per_kg': proposed_mat_cost_per_kg
-        }
-    
-    def calculate_weight(self, material, area_cm2, thickness_mm):
-        """Calculate part weight based on material, area and thickness"""
-        volume_cm3 = area_cm2 * thickness_mm / 10  # cm³
-        return (volume_cm3 / 1000000) * material['density']  # kg
-    
-    def display_results(self, results, inputs):
-        """Display analysis results with enhanced clarity"""
-        self.results_text.config(state='normal')
-        self.results_text.delete('1.0', 'end')
-        
-        # Determine savings interpretation
-        total_annual_saving = results['annual_material_saving'] + results['coil_change_saving']
-        saving_interpretation = "SAVINGS" if total_annual_saving > 0 else "EXTRA COST"
-        
-        # Calculate savings per metric ton for additional context
-        total_material_used_annual = results['current_weight_kg'] * inputs['annual_volume'] / 1000  # tons
-        saving_per_ton = total_annual_saving / total_material_used_annual if total_material_used_annual > 0 else 0
-        
-        report = f"""
-AUTOMOTIVE STAMPING COST ANALYSIS REPORT
-=======================================
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Version: {self.VERSION}
-Analysis Type: {results['thickness_note']}
-
-INPUT PARAMETERS:
-----------------
-Blank Geometry (CTL only): {inputs['part_length']} x {inputs['part_width']} mm
-Current Thickness: {inputs['current_thickness']} mm
-Optimized Thickness: {inputs['optimized_thickness']} mm
-Blank Area: {results['part_area_cm2']:.1f} cm²
-Annual Production: {inputs['annual_volume']:,} parts
-Current Material: {inputs['current_material']}
-Proposed Material: {inputs['proposed_material']}
-
-MATERIAL COSTS:
----------------
-Current Material: ${inputs['current_material_cost_mt']:,.0f}/MT (${results['current_mat_cost_per_kg']:.3f}/kg)
-Proposed Material: ${inputs['proposed_material_cost_mt']:,.0f}/MT (${results['proposed_mat_cost_per_kg']:.3f}/kg)
-
-WEIGHT ANALYSIS:
----------------
-Current Weight: {results['current_weight_kg']:.4f} kg
-Proposed Weight: {results['proposed_weight_kg']:.4f} kg
-Weight Saving per Part: {results['weight_saving_kg']:.4f} kg
-Weight Reduction: {results['weight_reduction_pct']:.1f}%
-
-MATERIAL COST ANALYSIS:
-----------------------
-Current Material Cost per Part: ${results['current_material_cost']:.4f}
-Proposed Material Cost per Part: ${results['proposed_material_cost']:.4f}
-Material Saving per Part: ${results['material_saving_per_part']:.4f}
-Annual Material Saving: ${results['annual_material_saving']:,.2f}
-
-STRIP PROCESSING EFFICIENCY:
----------------------------
-Current Parts per Strip: {results['current_parts_per_strip']:.0f}
-Proposed Parts per Strip: {results['proposed_parts_per_strip']:.0f}
-Coil Change Time Saving: ${results['coil_change_saving']:,.2f}
-
-SUMMARY (ANNUAL PRODUCTION):
-----------------------------
-Total Estimated Annual Saving: ${total_annual_saving:,.2f} USD
-
-BREAKDOWN PER METRIC TON:
--------------------------
-Annual Material Usage: {total_material_used_annual:,.1f} MT
-Saving per Metric Ton: ${saving_per_ton:,.2f} USD/MT
-
-INTERPRETATION:
----------------
-• ANNUAL SAVING: Total cost reduction for your annual production of {inputs['annual_volume']:,} parts
-• Positive values indicate COST SAVINGS
-• Negative values indicate EXTRA COST
-• Current result: {saving_interpretation} of ${abs(total_annual_saving):,.2f} USD per year
-
-RECOMMENDATIONS:
----------------
-1. {results['thickness_note']}
-2. Weight reduction: {results['weight_reduction_pct']:.1f}% per part
-3. Annual {saving_interpretation.lower()}: ${abs(total_annual_saving):,.2f} USD
-4. Equivalent to ${saving_per_ton:,.2f} USD savings per metric ton of material
-5. Improved strip efficiency: +{((results['proposed_parts_per_strip'] - results['current_parts_per_strip']) / results['current_parts_per_strip'] * 100):.1f}% parts per strip
-
-CURRENCY NOTE:
---------------
-All cost values are presented in USD. Use the currency conversion tool 
-in the Cost Parameters tab to convert to other currencies if needed.
-
-DEVELOPED BY:
--------------
-{self.DEVELOPER_INFO['name']} ({self.DEVELOPER_INFO['student_id']})
-{self.DEVELOPER_INFO['institution']}
-Projects: {self.DEVELOPER_INFO['projects']}
-Contact: {self.DEVELOPER_INFO['email']} | GitHub: {self.DEVELOPER_INFO['github']}
-"""
-        
-        self.results_text.insert('1.0', report)
-        self.results_text.config(state='disabled')
-        
-        # Show success message with savings interpretation
-        message_text = f"Cost analysis completed successfully!\n"
-        message_text += f"Result: {saving_interpretation} of ${abs(total_annual_saving):,.2f} USD per year"
-        messagebox.showinfo("Analysis Complete", message_text)
-
-def main():
-    """Main application entry point"""
-    root = tk.Tk()
-    app = AutomotiveStampingAnalyzer(root)
-    root.mainloop()
-
-if __name__ == "__main__":
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import json
+import string
+import os
+
+# Unit-conversion factors folded into single multiplies so the kernel
+# below constant-propagates them when JIT-compiled
+_KG_PER_MT = 1e-3       # $/MT -> $/kg
+_CM2_PER_MM2 = 1e-2     # mm^2 -> cm^2
+_KG_PER_CM2_MM = 1e-7   # blank mass per cm^2 area per mm thickness per unit density
+_MIN_TO_HR = 1.0 / 60.0
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; plain Python is the fallback
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True, fastmath=True)
+def _cost_kernel(current_density, proposed_density, part_area_cm2,
+                 current_thickness, optimized_thickness, analysis_code,
+                 current_cost_per_kg, proposed_cost_per_kg,
+                 annual_volume, coil_weight, coil_change_time,
+                 operator_hourly_rate):
+    """Scalar cost arithmetic for one analysis run, JIT-compiled when
+    numba is installed. analysis_code: 0 = material switch only,
+    1 = thickness optimization only, 2 = both."""
+    kg_per_mm = part_area_cm2 * _KG_PER_CM2_MM  # blank mass per mm thickness per unit density
+    current_weight = kg_per_mm * current_thickness * current_density
+    if analysis_code == 0:
+        proposed_weight = kg_per_mm * current_thickness * proposed_density
+    elif analysis_code == 1:
+        proposed_weight = kg_per_mm * optimized_thickness * current_density
+    else:
+        proposed_weight = kg_per_mm * optimized_thickness * proposed_density
+
+    current_material_cost = current_weight * current_cost_per_kg
+    proposed_material_cost = proposed_weight * proposed_cost_per_kg
+
+    weight_saving_kg = current_weight - proposed_weight
+    weight_reduction_pct = (weight_saving_kg / current_weight) * 100
+
+    material_saving_per_part = current_material_cost - proposed_material_cost
+    annual_material_saving = material_saving_per_part * annual_volume
+
+    current_parts_per_strip = (coil_weight / current_weight) * 0.85
+    proposed_parts_per_strip = (coil_weight / proposed_weight) * 0.85
+
+    current_coil_changes = annual_volume / current_parts_per_strip
+    proposed_coil_changes = annual_volume / proposed_parts_per_strip
+    coil_change_saving = ((current_coil_changes - proposed_coil_changes)
+                          * coil_change_time * _MIN_TO_HR * operator_hourly_rate)
+
+    return (current_weight, proposed_weight, weight_saving_kg,
+            weight_reduction_pct, current_material_cost,
+            proposed_material_cost, material_saving_per_part,
+            annual_material_saving, current_parts_per_strip,
+            proposed_parts_per_strip, coil_change_saving)
+
+# Results report precompiled once at import and rendered with a single
+# substitute() call, then inserted into the text widget in one Tk operation
+REPORT_TMPL = string.Template("""
+AUTOMOTIVE STAMPING COST ANALYSIS REPORT
+=======================================
+Generated: ${generated}
+Version: ${version}
+Analysis Type: ${thickness_note}
+
+INPUT PARAMETERS:
+----------------
+Blank Geometry (CTL only): ${part_length} x ${part_width} mm
+Current Thickness: ${current_thickness} mm
+Optimized Thickness: ${optimized_thickness} mm
+Blank Area: ${part_area_cm2} cm²
+Annual Production: ${annual_volume} parts
+Current Material: ${current_material}
+Proposed Material: ${proposed_material}
+
+MATERIAL COSTS:
+---------------
+Current Material: $${current_material_cost_mt}/MT ($${current_mat_cost_per_kg}/kg)
+Proposed Material: $${proposed_material_cost_mt}/MT ($${proposed_mat_cost_per_kg}/kg)
+
+WEIGHT ANALYSIS:
+---------------
+Current Weight: ${current_weight_kg} kg
+Proposed Weight: ${proposed_weight_kg} kg
+Weight Saving per Part: ${weight_saving_kg} kg
+Weight Reduction: ${weight_reduction_pct}%
+
+MATERIAL COST ANALYSIS:
+----------------------
+Current Material Cost per Part: $${current_material_cost}
+Proposed Material Cost per Part: $${proposed_material_cost}
+Material Saving per Part: $${material_saving_per_part}
+Annual Material Saving: $${annual_material_saving}
+
+STRIP PROCESSING EFFICIENCY:
+---------------------------
+Current Parts per Strip: ${current_parts_per_strip}
+Proposed Parts per Strip: ${proposed_parts_per_strip}
+Coil Change Time Saving: $${coil_change_saving}
+
+SUMMARY (ANNUAL PRODUCTION):
+----------------------------
+Total Estimated Annual Saving: $${total_annual_saving} USD
+
+BREAKDOWN PER METRIC TON:
+-------------------------
+Annual Material Usage: ${total_material_used_annual} MT
+Saving per Metric Ton: $${saving_per_ton} USD/MT
+
+INTERPRETATION:
+---------------
+• ANNUAL SAVING: Total cost reduction for your annual production of ${annual_volume} parts
+• Positive values indicate COST SAVINGS
+• Negative values indicate EXTRA COST
+• Current result: ${saving_interpretation} of $${abs_total_annual_saving} USD per year
+
+RECOMMENDATIONS:
+---------------
+1. ${thickness_note}
+2. Weight reduction: ${weight_reduction_pct}% per part
+3. Annual ${saving_interpretation_lower}: $${abs_total_annual_saving} USD
+4. Equivalent to $${saving_per_ton} USD savings per metric ton of material
+5. Improved strip efficiency: +${strip_efficiency_gain_pct}% parts per strip
+""")
+
+# Static report tail: only the developer fields vary, and those come
+# from the metadata JSON, so it is rendered once and appended verbatim
+_REPORT_FOOTER_TMPL = string.Template("""
+CURRENCY NOTE:
+--------------
+All cost values are presented in USD. Use the currency conversion tool
+in the Cost Parameters tab to convert to other currencies if needed.
+
+DEVELOPED BY:
+-------------
+${developer_name} (${developer_student_id})
+${developer_institution}
+Projects: ${developer_projects}
+Contact: ${developer_email} | GitHub: ${developer_github}
+""")
+
+# Numeric format applied to each value before substitution
+_REPORT_NUM_SPECS = {
+    'abs_total_annual_saving': ',.2f',
+    'annual_material_saving': ',.2f',
+    'annual_volume': ',',
+    'coil_change_saving': ',.2f',
+    'current_mat_cost_per_kg': '.3f',
+    'current_material_cost': '.4f',
+    'current_material_cost_mt': ',.0f',
+    'current_parts_per_strip': '.0f',
+    'current_weight_kg': '.4f',
+    'material_saving_per_part': '.4f',
+    'part_area_cm2': '.1f',
+    'proposed_mat_cost_per_kg': '.3f',
+    'proposed_material_cost': '.4f',
+    'proposed_material_cost_mt': ',.0f',
+    'proposed_parts_per_strip': '.0f',
+    'proposed_weight_kg': '.4f',
+    'saving_per_ton': ',.2f',
+    'strip_efficiency_gain_pct': '.1f',
+    'total_annual_saving': ',.2f',
+    'total_material_used_annual': ',.1f',
+    'weight_reduction_pct': '.1f',
+    'weight_saving_kg': '.4f',
+}
+
+# Bound str.format callables, built once so the format-spec
+# mini-language is not re-parsed on every report render
+_REPORT_NUM_FMTS = {name: ('{:' + spec + '}').format
+                    for name, spec in _REPORT_NUM_SPECS.items()}
+
+class CurrencyRates:
+    """Contiguous USD exchange-rate table with dict-style access.
+
+    The rates live in one float64 array so converting a set of USD
+    values to every currency is a single broadcast (usd * rates.arr)
+    instead of four dict lookups.
+    """
+
+    names = ('EUR', 'GBP', 'JPY', 'MXN')
+    __slots__ = ('arr',)
+
+    def __init__(self, eur, gbp, jpy, mxn):
+        self.arr = np.array([eur, gbp, jpy, mxn], dtype=np.float64)
+
+    def __getitem__(self, code):
+        return self.arr[self.names.index(code)]
+
+    def __setitem__(self, code, rate):
+        self.arr[self.names.index(code)] = rate
+
+class CachedEntry(ttk.Entry):
+    """ttk.Entry that memoizes the float parse of its current text"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_text = None
+        self._cached_value = None
+
+    def value(self):
+        """Return the entry contents as a float, reusing the last parse"""
+        text = self.get()
+        if text != self._cached_text:
+            self._cached_value = float(text)
+            self._cached_text = text
+        return self._cached_value
+
+class AutomotiveStampingAnalyzer:
+    """Comprehensive Automotive Stamping Cost Analysis with GUI"""
+
+    # Fixed attribute set: skips the per-instance __dict__ and keeps
+    # attribute access on the many widget handles cheap
+    __slots__ = (
+        'root', 'notebook', 'status_var', 'input_frame', 'materials_frame', 'costs_frame',
+        'results_frame', 'about_frame', '_tab_builders', '_after_ids', '_updating',
+        '_last_key', '_last_report', '_last_heights', '_last_message',
+        '_float_vars', '_float_entries', '_int_entries',
+        'materials', 'materials_df', 'mat_arrays', '_mat_idx', 'coil_width_options',
+        'coil_widths', '_material_names', '_mat_row_iids', 'materials_tree',
+        'cost_params', '_cost_param_names', 'cost_params_arr', 'cost_tree', '_cost_row_iids',
+        'currency_rates', 'eur_rate', 'gbp_rate', 'jpy_rate', 'mxn_rate',
+        'part_length', 'part_width',
+        'current_thickness', 'current_thickness_var',
+        'optimized_thickness', 'optimized_thickness_var',
+        'thickness_reduction_label',
+        'current_material_cost_mt', 'current_material_cost_mt_var',
+        'current_material_cost_cwt', 'current_material_cost_cwt_var',
+        'proposed_material_cost_mt', 'proposed_material_cost_mt_var',
+        'proposed_material_cost_cwt', 'proposed_material_cost_cwt_var',
+        'annual_volume', 'shifts_per_day', 'operating_days',
+        'coil_width', 'coil_weight', 'coil_change_time',
+        'current_material', 'proposed_material', 'analysis_type',
+        'results_text', 'fig', 'ax', 'canvas', '_bars', '_chart_bg'
+    )
+
+
+    # Version control
+    VERSION = "2.3.1"
+    RELEASE_DATE = "2025-10-22"
+
+    # Unit conversion: 1 MT = 22.046 cwt. The reciprocal is precomputed
+    # so conversion is a multiply and vectorizes over cost arrays.
+    _CWT_PER_MT = 22.046
+    _INV_CWT_PER_MT = 1.0 / 22.046
+    
+    # Change log, developer info and references live in a JSON sidecar
+    # next to this script, loaded on demand (About tab, report footer)
+    # instead of being allocated at import time
+    _METADATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  'budomari_metadata.json')
+    _metadata = None
+
+    @classmethod
+    def _load_metadata(cls):
+        """Load the metadata JSON once and cache it on the class"""
+        if cls._metadata is None:
+            with open(cls._METADATA_PATH, encoding='utf-8') as f:
+                cls._metadata = json.load(f)
+        return cls._metadata
+
+    @property
+    def CHANGE_LOG(self):
+        return self._load_metadata()['change_log']
+
+    @property
+    def DEVELOPER_INFO(self):
+        return self._load_metadata()['developer_info']
+
+    @property
+    def REFERENCES(self):
+        return self._load_metadata()['references']
+
+    # analysis_type -> (kernel code, report note). The integer code is
+    # what the JIT kernel branches on; the note feeds the report
+    _ANALYSIS_DISPATCH = {
+        'material': (0, "Material switch only (original thickness maintained)"),
+        'thickness': (1, "Thickness optimization only (current material)"),
+        'both': (2, "Material switch + thickness optimization"),
+    }
+
+    _report_footer_cache = None
+
+    @classmethod
+    def _report_footer(cls):
+        """Render the static report tail once per process"""
+        if cls._report_footer_cache is None:
+            dev = cls._load_metadata()['developer_info']
+            cls._report_footer_cache = _REPORT_FOOTER_TMPL.substitute(
+                developer_name=dev['name'],
+                developer_student_id=dev['student_id'],
+                developer_institution=dev['institution'],
+                developer_projects=dev['projects'],
+                developer_email=dev['email'],
+                developer_github=dev['github'])
+        return cls._report_footer_cache
+
+    _about_texts_cache = None
+
+    @classmethod
+    def _about_texts(cls):
+        """Build the static About-tab text blocks once and cache them.
+
+        The developer and software blocks never change after the
+        metadata JSON is read, so they are assembled with one join per
+        block on first use instead of per tab construction.
+        """
+        if cls._about_texts_cache is None:
+            dev = cls._load_metadata()['developer_info']
+            developer_text = "\n".join([
+                "",
+                dev['name'],
+                f"Student ID: {dev['student_id']}",
+                "",
+                "Institution:",
+                dev['institution'],
+                "",
+                "Projects:",
+                dev['projects'],
+                "",
+                "Contact:",
+                f"GitHub: {dev['github']}",
+                f"Email: {dev['email']}",
+                "",
+                "Specialties:",
+                "".join(f"• {specialty}\n" for specialty in dev['specialties']),
+            ])
+            software_text = f"""
+Automotive Stamping Cost Analyzer
+
+Version: {cls.VERSION}
+Release Date: {cls.RELEASE_DATE}
+
+This software provides comprehensive cost analysis
+for automotive stamping operations, including:
+
+• Material switching optimization
+• Thickness reduction analysis
+• Strip processing efficiency
+• Comprehensive overhead costing
+• Real-time cost savings estimation
+• Professional reporting
+
+Key Features:
+• Material database with 6 automotive materials
+• Thickness optimization calculations
+• Strip efficiency and nesting analysis
+• Labor, energy, and equipment cost integration
+• Multiple analysis types (material, thickness, or both)
+• Professional reporting with recommendations
+"""
+            cls._about_texts_cache = (developer_text, software_text)
+        return cls._about_texts_cache
+
+    def __init__(self, root):
+        self.root = root
+        self.root.title(f"Automotive Stamping Cost Analyzer v{self.VERSION}")
+        self.root.geometry("1400x900")
+        
+        # Initialize data
+        self.setup_materials_database()
+        self.setup_default_parameters()
+
+        # Pending after() tokens for debounced entry callbacks
+        self._after_ids = {}
+        # Guards the variable traces against programmatic sibling writes
+        self._updating = False
+        # Memoized last analysis (inputs key -> rendered report artifacts)
+        self._last_key = None
+        self._last_report = None
+        self._last_heights = None
+        self._last_message = None
+
+        # Non-blocking status bar; success feedback lands here instead
+        # of in a modal dialog that stalls the UI thread
+        self.status_var = tk.StringVar()
+        ttk.Label(root, textvariable=self.status_var, anchor='w',
+                  relief='sunken').pack(side='bottom', fill='x')
+
+        # Create GUI
+        self.create_gui()
+        
+    def setup_materials_database(self):
+        """Initialize materials database"""
+        self.materials = {
+            'Mild Steel': {
+                'density': 7.85, 'cost_per_kg': 0.8, 'scrap_value': 0.2,
+                'stamping_pressure_required': 400, 'energy_per_kg': 1.2,
+                'tooling_wear_factor': 1.0, 'processing_time': 1.0,
+                'typical_thickness_range': (0.6, 3.0),
+                'max_thickness_reduction': 0.15,
+                'formability_index': 1.0,
+                'springback_factor': 1.0,
+                'typical_coil_widths': [1200, 1500, 1800]
+            },
+            'High Strength Steel': {
+                'density': 7.85, 'cost_per_kg': 1.2, 'scrap_value': 0.25,
+                'stamping_pressure_required': 600, 'energy_per_kg': 1.5,
+                'tooling_wear_factor': 1.3, 'processing_time': 1.2,
+                'typical_thickness_range': (0.8, 2.5),
+                'max_thickness_reduction': 0.10,
+                'formability_index': 0.8,
+                'springback_factor': 1.3,
+                'typical_coil_widths': [1200, 1500]
+            },
+            'Aluminum 6061': {
+                'density': 2.7, 'cost_per_kg': 3.5, 'scrap_value': 1.8,
+                'stamping_pressure_required': 300, 'energy_per_kg': 0.8,
+                'tooling_wear_factor': 0.7, 'processing_time': 0.9,
+                'typical_thickness_range': (0.8, 4.0),
+                'max_thickness_reduction': 0.20,
+                'formability_index': 1.4,
+                'springback_factor': 0.7,
+                'typical_coil_widths': [1200, 1500, 2000]
+            },
+            'Aluminum 5052': {
+                'density': 2.68, 'cost_per_kg': 3.2, 'scrap_value': 1.6,
+                'stamping_pressure_required': 280, 'energy_per_kg': 0.75,
+                'tooling_wear_factor': 0.6, 'processing_time': 0.85,
+                'typical_thickness_range': (0.7, 3.5),
+                'max_thickness_reduction': 0.25,
+                'formability_index': 1.6,
+                'springback_factor': 0.6,
+                'typical_coil_widths': [1200, 1500, 2000]
+            },
+            'Advanced High Strength Steel': {
+                'density': 7.85, 'cost_per_kg': 1.8, 'scrap_value': 0.3,
+                'stamping_pressure_required': 800, 'energy_per_kg': 2.0,
+                'tooling_wear_factor': 1.8, 'processing_time': 1.5,
+                'typical_thickness_range': (0.9, 2.2),
+                'max_thickness_reduction': 0.08,
+                'formability_index': 0.6,
+                'springback_factor': 1.8,
+                'typical_coil_widths': [1200, 1500]
+            },
+            'Magnesium AZ31': {
+                'density': 1.74, 'cost_per_kg': 5.2, 'scrap_value': 2.5,
+                'stamping_pressure_required': 250, 'energy_per_kg': 0.6,
+                'tooling_wear_factor': 0.5, 'processing_time': 0.8,
+                'typical_thickness_range': (1.0, 4.5),
+                'max_thickness_reduction': 0.30,
+                'formability_index': 1.8,
+                'springback_factor': 0.5,
+                'typical_coil_widths': [1200, 1500, 2000]
+            }
+        }
+
+        # Column-oriented view of the database for vectorized comparisons
+        # across all materials at once. List-valued fields are kept apart
+        # since they don't fit a numeric column layout.
+        numeric_cols = [
+            'density', 'cost_per_kg', 'scrap_value',
+            'stamping_pressure_required', 'energy_per_kg',
+            'tooling_wear_factor', 'processing_time',
+            'max_thickness_reduction', 'formability_index', 'springback_factor'
+        ]
+        self.materials_df = pd.DataFrame.from_dict(
+            {name: {col: props[col] for col in numeric_cols}
+             for name, props in self.materials.items()},
+            orient='index')[numeric_cols]
+        self.mat_arrays = {col: self.materials_df[col].to_numpy() for col in numeric_cols}
+        # name -> row index into the SoA columns above
+        self._mat_idx = {name: i for i, name in enumerate(self.materials)}
+        self.coil_width_options = {name: props['typical_coil_widths']
+                                   for name, props in self.materials.items()}
+        self._material_names = tuple(self.materials)
+
+        # Padded width matrix (0 = unused slot) so coil compatibility can
+        # be answered for every material with one vectorized comparison
+        max_options = max(len(widths) for widths in self.coil_width_options.values())
+        self.coil_widths = np.array(
+            [widths + [0] * (max_options - len(widths))
+             for widths in self.coil_width_options.values()],
+            dtype=np.int16)
+
+    def smallest_compatible_coil_width(self, width_needed):
+        """Smallest stocked coil width per material that fits the blank (0 if none)"""
+        sentinel = np.iinfo(np.int16).max
+        mask = (self.coil_widths >= width_needed) & (self.coil_widths != 0)
+        best = np.where(mask, self.coil_widths, sentinel).min(axis=1)
+        return np.where(best == sentinel, 0, best)
+
+    def setup_default_parameters(self):
+        """Set default cost parameters"""
+        self.cost_params = {
+            'energy_cost_per_kwh': 0.12,
+            'operator_hourly_rate': 35.0,
+            'supervision_cost_per_operator': 15.0,
+            'maintenance_cost_per_hour': 25.0,
+            'equipment_depreciation_hourly': 40.0,
+            'facility_cost_per_hour': 15.0,
+            'tooling_cost_per_stroke': 0.02,
+            'quality_control_cost_per_part': 0.50,
+            'coil_handling_cost_per_ton': 50.0,
+            'scrap_processing_cost_per_kg': 0.10,
+            'shipping_cost_per_kg': 0.25
+        }
+        
+        # Ordered SoA view of the parameters so converting the whole set
+        # to another currency is a single numpy broadcast
+        self._cost_param_names = tuple(self.cost_params)
+        self.cost_params_arr = np.array([self.cost_params[name] for name in self._cost_param_names],
+                                        dtype=np.float64)
+
+        # Currency exchange rates (default values), stored contiguously
+        self.currency_rates = CurrencyRates(0.92, 0.79, 148.50, 17.25)
+    
+    def create_gui(self):
+        """Create the main GUI interface"""
+        # Create notebook for tabs
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
+
+        # Only the input tab is populated up front; the others are empty
+        # frames whose contents are built on first visit, which keeps
+        # startup free of Treeview/ScrolledText construction costs
+        self.input_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.input_frame, text="Part & Production")
+        self.materials_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.materials_frame, text="Material Properties")
+        self.costs_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.costs_frame, text="Cost Parameters")
+        self.results_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.results_frame, text="Analysis Results")
+        self.about_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.about_frame, text="About & Version")
+
+        self._tab_builders = {
+            str(self.materials_frame): self.setup_materials_tab,
+            str(self.costs_frame): self.setup_costs_tab,
+            str(self.results_frame): self.setup_results_tab,
+            str(self.about_frame): self.setup_about_tab
+        }
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
+        self.setup_input_tab()
+
+    def _build_tab(self, frame):
+        """Build a lazily-created tab's contents on first use"""
+        builder = self._tab_builders.pop(str(frame), None)
+        if builder is not None:
+            builder()
+
+    def _on_tab_changed(self, event=None):
+        self._build_tab(self.notebook.select())
+
+    def setup_input_tab(self):
+        """Setup input parameters tab"""
+
+        # Header
+        header_frame = ttk.LabelFrame(self.input_frame, text="Blank Geometry & Production Parameters")
+        header_frame.pack(fill='x', padx=5, pady=5)
+        
+        ttk.Label(header_frame, text=f"Automotive Stamping Cost Analyzer v{self.VERSION}", 
+                 font=('Arial', 12, 'bold')).pack(pady=5)
+        
+        # Blank Geometry (CTL only)
+        geometry_frame = ttk.LabelFrame(self.input_frame, text="Blank Geometry (CTL only)")
+        geometry_frame.pack(fill='x', padx=5, pady=5)
+        
+        # Row 1 - Basic dimensions
+        row1 = ttk.Frame(geometry_frame)
+        row1.pack(fill='x', pady=2)
+        
+        ttk.Label(row1, text="Length (mm):").grid(row=0, column=0, sticky='w', padx=5)
+        self.part_length = CachedEntry(row1, width=10)
+        self.part_length.insert(0, "800")
+        self.part_length.grid(row=0, column=1, padx=5)
+        
+        ttk.Label(row1, text="Width (mm):").grid(row=0, column=2, sticky='w', padx=5)
+        self.part_width = CachedEntry(row1, width=10)
+        self.part_width.insert(0, "600")
+        self.part_width.grid(row=0, column=3, padx=5)
+        
+        # Thickness Optimization Frame
+        thickness_frame = ttk.LabelFrame(self.input_frame, text="Thickness Optimization")
+        thickness_frame.pack(fill='x', padx=5, pady=5)
+        
+        # Row 2 - Current thickness
+        row2 = ttk.Frame(thickness_frame)
+        row2.pack(fill='x', pady=2)
+        
+        vcmd = (self.root.register(self._validate_numeric), '%P')
+
+        ttk.Label(row2, text="Current Thickness (mm):").grid(row=0, column=0, sticky='w', padx=5)
+        self.current_thickness_var = tk.DoubleVar(value=1.2)
+        self.current_thickness = ttk.Entry(row2, width=10, textvariable=self.current_thickness_var,
+                                           validate='key', validatecommand=vcmd)
+        self.current_thickness.grid(row=0, column=1, padx=5)
+
+        ttk.Label(row2, text="Optimized Thickness (mm):").grid(row=0, column=2, sticky='w', padx=5)
+        self.optimized_thickness_var = tk.DoubleVar(value=1.0)
+        self.optimized_thickness = ttk.Entry(row2, width=10, textvariable=self.optimized_thickness_var,
+                                             validate='key', validatecommand=vcmd)
+        self.optimized_thickness.grid(row=0, column=3, padx=5)
+        
+        ttk.Label(row2, text="Thickness Reduction (%):").grid(row=0, column=4, sticky='w', padx=5)
+        self.thickness_reduction_label = ttk.Label(row2, text="16.7%", foreground="blue")
+        self.thickness_reduction_label.grid(row=0, column=5, padx=5)
+        
+        # Recompute via variable traces (debounced to avoid per-keystroke work)
+        self.current_thickness_var.trace_add('write', lambda *args: self._on_var_write('thickness', self.calculate_thickness_reduction))
+        self.optimized_thickness_var.trace_add('write', lambda *args: self._on_var_write('thickness', self.calculate_thickness_reduction))
+        
+        # Material Cost Input Frame
+        material_cost_frame = ttk.LabelFrame(self.input_frame, text="Material Cost Input")
+        material_cost_frame.pack(fill='x', padx=5, pady=5)
+        
+        # Row 3 - Material cost inputs
+        row3 = ttk.Frame(material_cost_frame)
+        row3.pack(fill='x', pady=2)
+        
+        ttk.Label(row3, text="Current Material Cost ($/MT):").grid(row=0, column=0, sticky='w', padx=5)
+        self.current_material_cost_mt_var = tk.DoubleVar(value=800)
+        self.current_material_cost_mt = ttk.Entry(row3, width=12, textvariable=self.current_material_cost_mt_var,
+                                                  validate='key', validatecommand=vcmd)
+        self.current_material_cost_mt.grid(row=0, column=1, padx=5)
+
+        ttk.Label(row3, text="($/cwt):").grid(row=0, column=2, sticky='w', padx=5)
+        self.current_material_cost_cwt_var = tk.DoubleVar(value=36.29)
+        self.current_material_cost_cwt = ttk.Entry(row3, width=12, textvariable=self.current_material_cost_cwt_var,
+                                                   validate='key', validatecommand=vcmd)
+        self.current_material_cost_cwt.grid(row=0, column=3, padx=5)
+
+        ttk.Label(row3, text="Proposed Material Cost ($/MT):").grid(row=0, column=4, sticky='w', padx=5)
+        self.proposed_material_cost_mt_var = tk.DoubleVar(value=3200)
+        self.proposed_material_cost_mt = ttk.Entry(row3, width=12, textvariable=self.proposed_material_cost_mt_var,
+                                                   validate='key', validatecommand=vcmd)
+        self.proposed_material_cost_mt.grid(row=0, column=5, padx=5)
+
+        ttk.Label(row3, text="($/cwt):").grid(row=0, column=6, sticky='w', padx=5)
+        self.proposed_material_cost_cwt_var = tk.DoubleVar(value=145.15)
+        self.proposed_material_cost_cwt = ttk.Entry(row3, width=12, textvariable=self.proposed_material_cost_cwt_var,
+                                                    validate='key', validatecommand=vcmd)
+        self.proposed_material_cost_cwt.grid(row=0, column=7, padx=5)
+
+        # Sync the paired $/MT and $/cwt fields via variable traces
+        # (debounced, keyed per field)
+        self.current_material_cost_mt_var.trace_add('write', lambda *args: self._on_var_write('current_mt', lambda: self.convert_mt_to_cwt('current')))
+        self.current_material_cost_cwt_var.trace_add('write', lambda *args: self._on_var_write('current_cwt', lambda: self.convert_cwt_to_mt('current')))
+        self.proposed_material_cost_mt_var.trace_add('write', lambda *args: self._on_var_write('proposed_mt', lambda: self.convert_mt_to_cwt('proposed')))
+        self.proposed_material_cost_cwt_var.trace_add('write', lambda *args: self._on_var_write('proposed_cwt', lambda: self.convert_cwt_to_mt('proposed')))
+        
+        # Production Parameters
+        production_frame = ttk.LabelFrame(self.input_frame, text="Production Parameters")
+        production_frame.pack(fill='x', padx=5, pady=5)
+        
+        # Row 4
+        row4 = ttk.Frame(production_frame)
+        row4.pack(fill='x', pady=2)
+        
+        ttk.Label(row4, text="Annual Volume:").grid(row=0, column=0, sticky='w', padx=5)
+        self.annual_volume = CachedEntry(row4, width=15)
+        self.annual_volume.insert(0, "150000")
+        self.annual_volume.grid(row=0, column=1, padx=5)
+        
+        ttk.Label(row4, text="Shifts per Day:").grid(row=0, column=2, sticky='w', padx=5)
+        self.shifts_per_day = CachedEntry(row4, width=10)
+        self.shifts_per_day.insert(0, "2")
+        self.shifts_per_day.grid(row=0, column=3, padx=5)
+        
+        ttk.Label(row4, text="Operating Days/Year:").grid(row=0, column=4, sticky='w', padx=5)
+        self.operating_days = CachedEntry(row4, width=10)
+        self.operating_days.insert(0, "250")
+        self.operating_days.grid(row=0, column=5, padx=5)
+        
+        # Strip Parameters
+        strip_frame = ttk.LabelFrame(self.input_frame, text="Strip Parameters")
+        strip_frame.pack(fill='x', padx=5, pady=5)
+        
+        # Row 5
+        row5 = ttk.Frame(strip_frame)
+        row5.pack(fill='x', pady=2)
+        
+        ttk.Label(row5, text="Strip Width (mm):").grid(row=0, column=0, sticky='w', padx=5)
+        self.coil_width = CachedEntry(row5, width=10)
+        self.coil_width.insert(0, "1500")
+        self.coil_width.grid(row=0, column=1, padx=5)
+        
+        ttk.Label(row5, text="Strip Weight (kg):").grid(row=0, column=2, sticky='w', padx=5)
+        self.coil_weight = CachedEntry(row5, width=10)
+        self.coil_weight.insert(0, "20000")
+        self.coil_weight.grid(row=0, column=3, padx=5)
+        
+        ttk.Label(row5, text="Coil Change Time (min):").grid(row=0, column=4, sticky='w', padx=5)
+        self.coil_change_time = CachedEntry(row5, width=10)
+        self.coil_change_time.insert(0, "30")
+        self.coil_change_time.grid(row=0, column=5, padx=5)
+        
+        # Material Selection
+        material_frame = ttk.LabelFrame(self.input_frame, text="Material Selection")
+        material_frame.pack(fill='x', padx=5, pady=5)
+        
+        # Row 6
+        row6 = ttk.Frame(material_frame)
+        row6.pack(fill='x', pady=2)
+        
+        ttk.Label(row6, text="Current Material:").grid(row=0, column=0, sticky='w', padx=5)
+        self.current_material = ttk.Combobox(row6, values=self._material_names, width=15)
+        self.current_material.set("Mild Steel")
+        self.current_material.grid(row=0, column=1, padx=5)
+        
+        ttk.Label(row6, text="Proposed Material:").grid(row=0, column=2, sticky='w', padx=5)
+        self.proposed_material = ttk.Combobox(row6, values=self._material_names, width=15)
+        self.proposed_material.set("Aluminum 5052")
+        self.proposed_material.grid(row=0, column=3, padx=5)
+        
+        # Analysis Type
+        analysis_frame = ttk.LabelFrame(self.input_frame, text="Analysis Type")
+        analysis_frame.pack(fill='x', padx=5, pady=5)
+        
+        self.analysis_type = tk.StringVar(value="both")
+        ttk.Radiobutton(analysis_frame, text="Material Switch Only", 
+                       variable=self.analysis_type, value="material").pack(side='left', padx=10)
+        ttk.Radiobutton(analysis_frame, text="Thickness Optimization Only", 
+                       variable=self.analysis_type, value="thickness").pack(side='left', padx=10)
+        ttk.Radiobutton(analysis_frame, text="Both Material Switch & Thickness Optimization", 
+                       variable=self.analysis_type, value="both").pack(side='left', padx=10)
+        
+        # Calculate Button
+        button_frame = ttk.Frame(self.input_frame)
+        button_frame.pack(fill='x', pady=10)
+        
+        ttk.Button(button_frame, text="Calculate Cost Analysis",
+                  command=self.calculate_analysis).pack(pady=5)
+
+        # Input registries so get_input_values can snapshot everything
+        # with comprehensions instead of fifteen hand-written reads.
+        # DoubleVars return floats straight from Tcl; CachedEntry.value()
+        # memoizes its float parse.
+        self._float_vars = {
+            'current_thickness': self.current_thickness_var,
+            'optimized_thickness': self.optimized_thickness_var,
+            'current_material_cost_mt': self.current_material_cost_mt_var,
+            'proposed_material_cost_mt': self.proposed_material_cost_mt_var,
+        }
+        self._float_entries = {
+            'part_length': self.part_length,
+            'part_width': self.part_width,
+            'coil_width': self.coil_width,
+            'coil_weight': self.coil_weight,
+            'coil_change_time': self.coil_change_time,
+        }
+        self._int_entries = {
+            'annual_volume': self.annual_volume,
+            'shifts_per_day': self.shifts_per_day,
+            'operating_days': self.operating_days,
+        }
+
+    def schedule_recalc(self, key, callback, delay_ms=150):
+        """Debounce an entry recompute: run callback ~150 ms after the last keystroke"""
+        pending = self._after_ids.get(key)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._after_ids[key] = self.root.after(delay_ms, callback)
+
+    def _on_var_write(self, key, callback):
+        """Trace callback: schedule a recompute unless we caused the write"""
+        if not self._updating:
+            self.schedule_recalc(key, callback)
+
+    def _validate_numeric(self, text):
+        """Allow only text that is (or can become) a valid number"""
+        if text in ('', '-', '.', '-.'):
+            return True
+        try:
+            float(text)
+            return True
+        except ValueError:
+            return False
+
+    def _cost_var_pair(self, material_type):
+        """Return the ($/MT, $/cwt) variable pair for a material side"""
+        if material_type == 'current':
+            return self.current_material_cost_mt_var, self.current_material_cost_cwt_var
+        return self.proposed_material_cost_mt_var, self.proposed_material_cost_cwt_var
+
+    def convert_mt_to_cwt(self, material_type):
+        """Convert $/MT to $/cwt"""
+        mt_var, cwt_var = self._cost_var_pair(material_type)
+        try:
+            cwt_value = mt_var.get() * self._INV_CWT_PER_MT
+        except tk.TclError:
+            return
+        self._updating = True
+        try:
+            cwt_var.set(round(cwt_value, 2))
+        finally:
+            self._updating = False
+
+    def convert_cwt_to_mt(self, material_type):
+        """Convert $/cwt to $/MT"""
+        mt_var, cwt_var = self._cost_var_pair(material_type)
+        try:
+            mt_value = cwt_var.get() * self._CWT_PER_MT
+        except tk.TclError:
+            return
+        self._updating = True
+        try:
+            mt_var.set(round(mt_value))
+        finally:
+            self._updating = False
+
+    def calculate_thickness_reduction(self, event=None):
+        """Calculate and display thickness reduction percentage"""
+        try:
+            current = self.current_thickness_var.get()
+            optimized = self.optimized_thickness_var.get()
+            reduction = ((current - optimized) / current) * 100
+            self.thickness_reduction_label.config(text=f"{reduction:.1f}%")
+            
+            # Color code based on reduction
+            if reduction > 20:
+                self.thickness_reduction_label.config(foreground="green")
+            elif reduction > 10:
+                self.thickness_reduction_label.config(foreground="blue")
+            else:
+                self.thickness_reduction_label.config(foreground="orange")
+                
+        except (tk.TclError, ZeroDivisionError):
+            self.thickness_reduction_label.config(text="0.0%")
+    
+    # Display rows for the materials tab, derived from the database view
+    # so the tab always matches self.materials_df instead of a hand-kept copy
+    _MATERIAL_PROPERTY_ROWS = [
+        ('Density (g/cm³)', 'density', '{:.2f}'),
+        ('Cost ($/kg)', 'cost_per_kg', '{:.2f}'),
+        ('Scrap Value ($/kg)', 'scrap_value', '{:.2f}'),
+        ('Stamping Pressure (MPa)', 'stamping_pressure_required', '{:.0f}'),
+        ('Energy (kWh/kg)', 'energy_per_kg', '{:.2f}'),
+        ('Tool Wear Factor', 'tooling_wear_factor', '{:.2f}'),
+        ('Processing Time (s)', 'processing_time', '{:.2f}'),
+        ('Max Thickness Reduction', 'max_thickness_reduction', '{:.0%}'),
+        ('Formability Index', 'formability_index', '{:.2f}')
+    ]
+
+    def _format_material_rows(self):
+        """Format one Treeview row per property from the database view"""
+        return [(label,) + tuple(fmt.format(v) for v in self.mat_arrays[col])
+                for label, col, fmt in self._MATERIAL_PROPERTY_ROWS]
+
+    def refresh_materials_tab(self):
+        """Update the existing Treeview rows in place after a database edit"""
+        for iid, row in zip(self._mat_row_iids, self._format_material_rows()):
+            self.materials_tree.item(iid, values=row)
+
+    def setup_materials_tab(self):
+        """Setup materials properties tab"""
+        # Create treeview for materials
+        columns = ('Property', 'Mild Steel', 'High Strength Steel', 'Aluminum 6061', 'Aluminum 5052', 'AHSS', 'Magnesium')
+        self.materials_tree = ttk.Treeview(self.materials_frame, columns=columns, show='headings', height=15)
+        
+        for col in columns:
+            self.materials_tree.heading(col, text=col)
+            self.materials_tree.column(col, width=100)
+        
+        # Insert the derived rows once, remembering the item ids so any
+        # later refresh mutates cells in place instead of rebuilding rows
+        self._mat_row_iids = [
+            self.materials_tree.insert('', 'end', values=row)
+            for row in self._format_material_rows()
+        ]
+        
+        self.materials_tree.pack(fill='both', expand=True, padx=5, pady=5)
+        
+        # Notes frame
+        notes_frame = ttk.LabelFrame(self.materials_frame, text="Material Selection Notes")
+        notes_frame.pack(fill='x', padx=5, pady=5)
+        
+        notes_text = """
+        • Mild Steel: Cost-effective, good formability, higher weight
+        • High Strength Steel: Higher strength, reduced thickness possible, higher tool wear
+        • Aluminum 6061: Good strength-to-weight, excellent corrosion resistance
+        • Aluminum 5052: Excellent formability, good corrosion resistance, lower strength than 6061
+        • Advanced High Strength Steel (AHSS): Highest strength, limited formability, high tool wear
+        • Magnesium AZ31: Lightest option, excellent formability, higher material cost
+        """
+        
+        ttk.Label(notes_frame, text=notes_text, justify='left').pack(padx=5, pady=5)
+    
+    def setup_costs_tab(self):
+        """Setup cost parameters tab with currency conversion"""
+        # Create main container with two columns
+        main_container = ttk.Frame(self.costs_frame)
+        main_container.pack(fill='both', expand=True, padx=5, pady=5)
+        
+        # Left Column - Cost Parameters
+        cost_params_frame = ttk.LabelFrame(main_container, text="Cost Parameters (All values in USD)")
+        cost_params_frame.pack(side='left', fill='both', expand=True, padx=(0, 5))
+        
+        # A single Treeview holds every parameter; double-clicking a value
+        # cell pops a transient entry over it. One native widget instead
+        # of eleven Label/Entry pairs, and edits batch straight into the
+        # SoA array.
+        self.cost_tree = ttk.Treeview(cost_params_frame, columns=('value',),
+                                      show='tree headings',
+                                      height=len(self._cost_param_names))
+        self.cost_tree.heading('#0', text='Parameter')
+        self.cost_tree.heading('value', text='Value (USD)')
+        self.cost_tree.column('#0', width=260, anchor='w')
+        self.cost_tree.column('value', width=110, anchor='e')
+
+        self._cost_row_iids = {}
+        for name in self._cost_param_names:
+            label = name.replace('_', ' ').title()
+            iid = self.cost_tree.insert('', 'end', text=label, values=(self.cost_params[name],))
+            self._cost_row_iids[iid] = name
+
+        self.cost_tree.pack(fill='both', expand=True, padx=5, pady=5)
+        self.cost_tree.bind('<Double-1>', self._edit_cost_cell)
+
+        ttk.Label(cost_params_frame, text="Double-click a value to edit it",
+                  font=('Arial', 8), foreground='blue').pack(pady=(0, 5))
+        
+        # Right Column - Currency Conversion
+        currency_frame = ttk.LabelFrame(main_container, text="Currency Conversion (from USD)")
+        currency_frame.pack(side='right', fill='both', expand=True, padx=(5, 0))
+        
+        # Currency exchange rate inputs
+        ttk.Label(currency_frame, text="Euro (EUR):", font=('Arial', 9, 'bold')).grid(row=0, column=0, sticky='w', padx=5, pady=2)
+        self.eur_rate = ttk.Entry(currency_frame, width=10)
+        self.eur_rate.insert(0, str(self.currency_rates['EUR']))
+        self.eur_rate.grid(row=0, column=1, padx=5, pady=2)
+        
+        ttk.Label(currency_frame, text="British Pound (GBP):", font=('Arial', 9, 'bold')).grid(row=1, column=0, sticky='w', padx=5, pady=2)
+        self.gbp_rate = ttk.Entry(currency_frame, width=10)
+        self.gbp_rate.insert(0, str(self.currency_rates['GBP']))
+        self.gbp_rate.grid(row=1, column=1, padx=5, pady=2)
+        
+        ttk.Label(currency_frame, text="Japanese Yen (JPY):", font=('Arial', 9, 'bold')).grid(row=2, column=0, sticky='w', padx=5, pady=2)
+        self.jpy_rate = ttk.Entry(currency_frame, width=10)
+        self.jpy_rate.insert(0, str(self.currency_rates['JPY']))
+        self.jpy_rate.grid(row=2, column=1, padx=5, pady=2)
+        
+        ttk.Label(currency_frame, text="Mexican Peso (MXN):", font=('Arial', 9, 'bold')).grid(row=3, column=0, sticky='w', padx=5, pady=2)
+        self.mxn_rate = ttk.Entry(currency_frame, width=10)
+        self.mxn_rate.insert(0, str(self.currency_rates['MXN']))
+        self.mxn_rate.grid(row=3, column=1, padx=5, pady=2)
+        
+        # Convert button
+        ttk.Button(currency_frame, text="Update Exchange Rates", 
+                  command=self.update_currency_rates).grid(row=4, column=0, columnspan=2, pady=10)
+        
+        # Conversion example
+        example_label = ttk.Label(currency_frame, text="Note: Enter exchange rates as units of foreign currency per 1 USD", 
+                                 font=('Arial', 8), foreground='blue')
+        example_label.grid(row=5, column=0, columnspan=2, pady=5)
+    
+    def update_currency_rates(self):
+        """Update currency exchange rates from user input"""
+        try:
+            self.currency_rates['EUR'] = float(self.eur_rate.get())
+            self.currency_rates['GBP'] = float(self.gbp_rate.get())
+            self.currency_rates['JPY'] = float(self.jpy_rate.get())
+            self.currency_rates['MXN'] = float(self.mxn_rate.get())
+            self.status_var.set("Currency exchange rates updated successfully!")
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid input in exchange rates: {e}")
+    
+    def setup_results_tab(self):
+        """Setup results display tab"""
+        # matplotlib is imported here, not at module level: pyplot-style
+        # setup pulls in the font cache and backend manager (~hundreds of
+        # ms on cold start) and this tab is built lazily on first visit.
+        # Pinning TkAgg up front also skips backend auto-detection.
+        import matplotlib
+        matplotlib.use('TkAgg')
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        # Results text area
+        self.results_text = scrolledtext.ScrolledText(self.results_frame, width=100, height=30)
+        self.results_text.pack(fill='both', expand=True, padx=5, pady=5)
+        
+        # Default message
+        self.results_text.insert('1.0', "Click 'Calculate Cost Analysis' in the Part & Production tab to generate results.")
+        self.results_text.config(state='disabled')
+
+        # One Figure/Canvas pair created up front and reused across runs
+        # so recalculating never tears down and rebuilds the Agg backend
+        # or the Tk photo image. The bars are persistent artists updated
+        # via set_height(); repeat draws blit only the bars over a cached
+        # background instead of re-rasterizing the whole figure
+        self.fig = Figure(figsize=(8, 3), constrained_layout=False)
+        self.ax = self.fig.add_subplot(111)
+        self.ax.set_ylabel('Material cost per part (USD)')
+        self.ax.set_title('Material Cost Comparison')
+        self._bars = self.ax.bar(['Current', 'Proposed'], [0.0, 0.0],
+                                 color=['steelblue', 'seagreen'])
+        self._chart_bg = None
+        self.canvas = FigureCanvasTkAgg(self.fig, self.results_frame)
+        self.canvas.get_tk_widget().pack(fill='x', padx=5, pady=5)
+
+    def _redraw_chart(self, heights):
+        """Update the comparison bars, blitting when the axes are unchanged"""
+        for bar, height in zip(self._bars, heights):
+            bar.set_height(height)
+
+        top = max(max(heights), 0.0) * 1.1 or 1.0
+        if self._chart_bg is None or top > self.ax.get_ylim()[1] or top < 0.3 * self.ax.get_ylim()[1]:
+            # Axes limits changed: full draw, then cache the static
+            # background (axes, gridlines, labels) without the bars
+            self.ax.set_ylim(0, top)
+            for bar in self._bars:
+                bar.set_visible(False)
+            self.canvas.draw()
+            self._chart_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+            for bar in self._bars:
+                bar.set_visible(True)
+
+        self.canvas.restore_region(self._chart_bg)
+        for bar in self._bars:
+            self.ax.draw_artist(bar)
+        self.canvas.blit(self.ax.bbox)
+    
+    def setup_about_tab(self):
+        """Setup about information tab with three-column layout"""
+        # Create main container with three columns
+        main_container = ttk.Frame(self.about_frame)
+        main_container.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # Left Column - Developer Information
+        left_frame = ttk.LabelFrame(main_container, text="Developer Information")
+        left_frame.pack(side='left', fill='both', expand=True, padx=(0, 5))
+        
+        developer_text, software_text = self._about_texts()
+
+        developer_label = ttk.Label(left_frame, text=developer_text, justify='left')
+        developer_label.pack(padx=10, pady=10, fill='both', expand=True)
+
+        # Middle Column - Software Information
+        middle_frame = ttk.LabelFrame(main_container, text="Software Information")
+        middle_frame.pack(side='left', fill='both', expand=True, padx=5)
+
+        software_label = ttk.Label(middle_frame, text=software_text, justify='left')
+        software_label.pack(padx=10, pady=10, fill='both', expand=True)
+        
+        # Right Column - References
+        right_frame = ttk.LabelFrame(main_container, text="References & Bibliography")
+        right_frame.pack(side='right', fill='both', expand=True, padx=(5, 0))
+        
+        # A Treeview only lays out and paints the rows currently in view,
+        # so scrolling stays O(visible rows) however long the
+        # bibliography grows
+        references_tree = ttk.Treeview(right_frame, show='tree', selectmode='none', height=20)
+        ref_scroll = ttk.Scrollbar(right_frame, orient='vertical', command=references_tree.yview)
+        references_tree.configure(yscrollcommand=ref_scroll.set)
+
+        # Populate before packing: an unmapped widget triggers no layout
+        # or paint work per row, so Tk does a single pass when it appears
+        for category in self.REFERENCES:
+            parent = references_tree.insert('', 'end', text=category['category'].upper(), open=True)
+            for source in category['sources']:
+                references_tree.insert(parent, 'end', text=f"• {source}")
+
+        ref_scroll.pack(side='right', fill='y', pady=10)
+        references_tree.pack(fill='both', expand=True, padx=(10, 0), pady=10)
+        
+        # Version History - Full width below the three columns
+        log_frame = ttk.LabelFrame(self.about_frame, text="Version History & Change Log")
+        log_frame.pack(fill='both', expand=True, padx=10, pady=(10, 5))
+        
+        # Same lazily-rendered Treeview treatment as the references list
+        log_tree = ttk.Treeview(log_frame, show='tree', selectmode='none', height=15)
+        log_scroll = ttk.Scrollbar(log_frame, orient='vertical', command=log_tree.yview)
+        log_tree.configure(yscrollcommand=log_scroll.set)
+
+        # Same fill-then-map ordering as the references tree
+        for version_info in self.CHANGE_LOG:
+            parent = log_tree.insert('', 'end', open=True,
+                                     text=f"Version {version_info['version']} ({version_info['date']})")
+            for change in version_info['changes']:
+                log_tree.insert(parent, 'end', text=f"• {change}")
+
+        log_scroll.pack(side='right', fill='y', pady=5)
+        log_tree.pack(fill='both', expand=True, padx=(5, 0), pady=5)
+    
+    def _edit_cost_cell(self, event):
+        """Pop a transient entry over the double-clicked value cell"""
+        iid = self.cost_tree.identify_row(event.y)
+        if not iid or self.cost_tree.identify_column(event.x) != '#1':
+            return
+        x, y, w, h = self.cost_tree.bbox(iid, 'value')
+        editor = ttk.Entry(self.cost_tree)
+        editor.insert(0, self.cost_tree.set(iid, 'value'))
+        editor.select_range(0, tk.END)
+        editor.place(x=x, y=y, width=w, height=h)
+        editor.focus_set()
+        editor.bind('<Return>', lambda e: self._commit_cost_edit(iid, editor))
+        editor.bind('<FocusOut>', lambda e: self._commit_cost_edit(iid, editor))
+        editor.bind('<Escape>', lambda e: editor.destroy())
+
+    def _commit_cost_edit(self, iid, editor):
+        """Write an edited cell back to the dict and the SoA array"""
+        if not editor.winfo_exists():
+            return
+        text = editor.get()
+        editor.destroy()
+        try:
+            value = float(text)
+        except ValueError:
+            messagebox.showerror("Error", f"Invalid input in cost parameters: {text!r}")
+            return
+        name = self._cost_row_iids[iid]
+        self.cost_params[name] = value
+        self.cost_params_arr[self._cost_param_names.index(name)] = value
+        self.cost_tree.set(iid, 'value', value)
+        # Cost parameters feed the analysis, so the memoized report is stale
+        self._last_key = None
+    
+    def calculate_analysis(self):
+        """Perform comprehensive cost analysis"""
+        # Validation failures surface in the status bar without a modal
+        # and leave the last good report on screen
+        inputs, error = self.try_get_input_values()
+        if error is not None:
+            self.status_var.set(f"Input error: {error}")
+            return
+
+        # Identical inputs render an identical report: reuse the
+        # cached text and chart heights instead of recomputing
+        key = tuple(sorted(inputs.items()))
+        if key == self._last_key:
+            self._show_report(self._last_report, self._last_heights, self._last_message)
+            return
+
+        try:
+            # Perform calculations
+            results = self.perform_calculations(inputs)
+
+            # Display results
+            self.display_results(results, inputs)
+            self._last_key = key
+
+        except Exception as e:
+            messagebox.showerror("Calculation Error", f"An error occurred during calculation: {e}")
+
+    def try_get_input_values(self):
+        """Snapshot and validate the inputs without raising.
+
+        Returns (inputs, None) on success, or (None, message) when a
+        field fails to parse or a material name is unknown.
+        """
+        try:
+            return self.get_input_values(), None
+        except (ValueError, tk.TclError) as e:
+            return None, str(e)
+
+    def get_input_values(self):
+        """Get and validate input values"""
+        inputs = {key: var.get() for key, var in self._float_vars.items()}
+        inputs.update((key, entry.value()) for key, entry in self._float_entries.items())
+        inputs.update((key, int(entry.value())) for key, entry in self._int_entries.items())
+        inputs.update(
+            current_material=self.current_material.get(),
+            proposed_material=self.proposed_material.get(),
+            analysis_type=self.analysis_type.get()
+        )
+
+
+        # Validate materials
+        if inputs['current_material'] not in self.materials:
+            raise ValueError(f"Invalid current material: {inputs['current_material']}")
+        if inputs['proposed_material'] not in self.materials:
+            raise ValueError(f"Invalid proposed material: {inputs['proposed_material']}")
+        
+        # Validate thickness reduction
+        max_reduction = self.mat_arrays['max_thickness_reduction'][self._mat_idx[inputs['current_material']]]
+        actual_reduction = (inputs['current_thickness'] - inputs['optimized_thickness']) / inputs['current_thickness']
+        
+        if actual_reduction > max_reduction:
+            messagebox.showwarning("Thickness Warning", 
+                                 f"Warning: Proposed thickness reduction ({actual_reduction:.1%}) exceeds maximum recommended ({max_reduction:.1%}) for {inputs['current_material']}")
+        
+        return inputs
+    
+    def perform_calculations(self, inputs):
+        """Perform the main cost calculations"""
+        # Single indexed reads from the SoA columns instead of chained
+        # dict-of-dict lookups
+        density = self.mat_arrays['density']
+        current_density = density[self._mat_idx[inputs['current_material']]]
+        proposed_density = density[self._mat_idx[inputs['proposed_material']]]
+
+        # Override material costs with user inputs (convert $/MT to $/kg)
+        current_mat_cost_per_kg = inputs['current_material_cost_mt'] * _KG_PER_MT
+        proposed_mat_cost_per_kg = inputs['proposed_material_cost_mt'] * _KG_PER_MT
+
+        # Calculate part area
+        part_area_cm2 = inputs['part_length'] * inputs['part_width'] * _CM2_PER_MM2  # cm²
+
+        # Scenario dispatch is a table lookup rather than string compares
+        analysis_code, thickness_note = self._ANALYSIS_DISPATCH[inputs['analysis_type']]
+        if analysis_code == 1:
+            inputs['proposed_material'] = inputs['current_material']  # Override for reporting
+
+        # All numeric work happens in the (optionally JIT-compiled) kernel
+        (current_weight, proposed_weight, weight_saving_kg,
+         weight_reduction_pct, current_material_cost,
+         proposed_material_cost, material_saving_per_part,
+         annual_material_saving, current_parts_per_strip,
+         proposed_parts_per_strip, coil_change_saving) = _cost_kernel(
+            current_density, proposed_density, part_area_cm2,
+            inputs['current_thickness'], inputs['optimized_thickness'],
+            analysis_code, current_mat_cost_per_kg, proposed_mat_cost_per_kg,
+            inputs['annual_volume'], inputs['coil_weight'],
+            inputs['coil_change_time'], self.cost_params['operator_hourly_rate'])
+
+        return {
+            'current_weight_kg': current_weight,
+            'proposed_weight_kg': proposed_weight,
+            'weight_saving_kg': weight_saving_kg,
+            'weight_reduction_pct': weight_reduction_pct,
+            'current_material_cost': current_material_cost,
+            'proposed_material_cost': proposed_material_cost,
+            'material_saving_per_part': material_saving_per_part,
+            'annual_material_saving': annual_material_saving,
+            'current_parts_per_strip': current_parts_per_strip,
+            'proposed_parts_per_strip': proposed_parts_per_strip,
+            'coil_change_saving': coil_change_saving,
+            'part_area_cm2': part_area_cm2,
+            'thickness_note': thickness_note,
+            'analysis_type': inputs['analysis_type'],
+            'current_mat_cost_per_kg': current_mat_cost_per_kg,
+            'proposed_mat_cost_per_kg': proposed_mat_cost_per_kg
+        }
+    
+    @staticmethod
+    def calculate_weight(density, area_cm2, thickness_mm):
+        """Part weight in kg; broadcasts over array densities/thicknesses.
+
+        Accepts scalars or NumPy arrays, so a sweep over every material
+        (or a thickness grid) is a single vectorized expression, e.g.
+        calculate_weight(self.mat_arrays['density'], area, thk).
+        """
+        return area_cm2 * thickness_mm * _KG_PER_CM2_MM * density
+    
+    def display_results(self, results, inputs):
+        """Display analysis results with enhanced clarity"""
+        # Determine savings interpretation
+        total_annual_saving = results['annual_material_saving'] + results['coil_change_saving']
+        saving_interpretation = "SAVINGS" if total_annual_saving > 0 else "EXTRA COST"
+        
+        # Calculate savings per metric ton for additional context
+        total_material_used_annual = results['current_weight_kg'] * inputs['annual_volume'] / 1000  # tons
+        saving_per_ton = total_annual_saving / total_material_used_annual if total_material_used_annual > 0 else 0
+        
+        mapping = dict(results, **inputs)
+        mapping.update(
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            version=self.VERSION,
+            total_annual_saving=total_annual_saving,
+            abs_total_annual_saving=abs(total_annual_saving),
+            saving_interpretation=saving_interpretation,
+            saving_interpretation_lower=saving_interpretation.lower(),
+            total_material_used_annual=total_material_used_annual,
+            saving_per_ton=saving_per_ton,
+            strip_efficiency_gain_pct=((results['proposed_parts_per_strip'] - results['current_parts_per_strip'])
+                                       / results['current_parts_per_strip'] * 100)
+        )
+        mapping.update({key: fmt(mapping[key])
+                        for key, fmt in _REPORT_NUM_FMTS.items()})
+        report = REPORT_TMPL.substitute(mapping) + self._report_footer()
+
+        heights = [results['current_material_cost'], results['proposed_material_cost']]
+        message_text = (f"Cost analysis completed successfully!\n"
+                        f"Result: {saving_interpretation} of ${abs(total_annual_saving):,.2f} USD per year")
+
+        # Cache the rendered artifacts so a repeat run with unchanged
+        # inputs can skip straight to _show_report
+        self._last_report = report
+        self._last_heights = heights
+        self._last_message = message_text
+        self._show_report(report, heights, message_text)
+
+    def _show_report(self, report, heights, message_text):
+        """Push an already-rendered report into the widgets"""
+        # The results tab is built lazily; make sure it exists
+        self._build_tab(self.results_frame)
+        self.results_text.config(state='normal')
+        self.results_text.delete('1.0', 'end')
+        self.results_text.insert('1.0', report)
+        self.results_text.config(state='disabled')
+
+        # Refresh the reusable comparison chart in place
+        self._redraw_chart(heights)
+
+        # Show success message with savings interpretation
+        self.status_var.set(message_text.replace('\n', ' — '))
+
+def main():
+    """Main application entry point"""
+    root = tk.Tk()
+    app = AutomotiveStampingAnalyzer(root)
+    root.mainloop()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file